@@ -1,11 +1,35 @@
+import io
+import os
+import time
+import struct
+import threading
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import serialization, hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.fernet import Fernet
 
 # 알고리즘이 사용하는 비트
 HASH_PADDING = 256
 
+# RSA 암호화에 사용하는 OAEP padding (상태가 없으므로 모든 메시지에서 재사용)
+OAEP = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()),
+                    algorithm=hashes.SHA256(),
+                    label=None)
+
+# stream 암호화 형식: magic, 암호화된 AES key의 길이, chunk 크기 + 암호화된 AES key + chunk의 목록
+STREAM_MAGIC = b'HYB\x01'
+STREAM_HEADER = struct.Struct('>4sHI')
+# chunk: 4 bytes 길이 (최상위 비트는 마지막 chunk 표시) + AES-GCM 암호문 (tag 16 bytes 포함)
+CHUNK_HEADER = struct.Struct('>I')
+CHUNK_FINAL = 0x80000000
+# 기본 chunk 크기 (평문 기준)
+CHUNK_SIZE = 64 * 1024
+# AES-GCM의 tag 크기
+TAG_SIZE = 16
+# 96비트 nonce: 앞 4 bytes는 0, 뒤 8 bytes는 chunk의 번호 (stream마다 새로운 key를 사용하므로 중복되지 않음)
+NONCE = struct.Struct('>4xQ')
+
 
 def is_long_text(plain_text: str, key_size: int):
     """
@@ -27,22 +51,125 @@ def read_keys():
     """
     같은 디렉토리에 있는 공개 키인 'public_key.pem' 파일과
     개인 키인 'private_key.pem' 파일을 읽어 각 키에 적합한 객체로 반환하는 함수
+    파일은 registry를 통해 읽으므로, 파일이 바뀌지 않았으면 이전에 읽은 key 객체를 그대로 반환함
 
     Returns:
         PUBLIC_KEY_TYPES, PRIVATE_KEY_TYPES : 각 키 파일을 읽은 값
     """
 
-    # public_key.pem 읽기
-    with open('public_key.pem', 'rb') as key_file:
-        public_key = serialization.load_pem_public_key(
-            key_file.read(), backend=default_backend())
+    return registry.read_keys()
+
+
+def load_public_key(data: bytes):
+    """
+    PEM 형식의 공개 키를 객체로 변환하는 함수
+
+    Args:
+        data (bytes): PEM 파일의 내용
+
+    Returns:
+        PUBLIC_KEY_TYPES: 공개 키
+    """
+
+    return serialization.load_pem_public_key(data, backend=default_backend())
+
+
+def load_private_key(data: bytes):
+    """
+    PEM 형식의 개인 키를 객체로 변환하는 함수
+
+    Args:
+        data (bytes): PEM 파일의 내용
+
+    Returns:
+        PRIVATE_KEY_TYPES: 개인 키
+    """
+
+    return serialization.load_pem_private_key(data, password=None, backend=default_backend())
+
+
+class KeyRegistry:
+    """
+    PEM 파일을 한 번만 읽어 key 객체를 보관하는 저장소
+    check_interval초마다 파일의 수정 시간과 크기를 확인하여 파일이 바뀐 경우에만 다시 읽음 (hot reload)
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        # 절대 경로 -> [key 객체, (수정 시간, 크기, inode), 마지막으로 확인한 시간]
+        self.entries = {}
+        self.lock = threading.Lock()
+        # 파일을 읽은 횟수
+        self.loads = 0
+
+    def load(self, path: str, loader):
+        """
+        path의 key 객체를 반환, 처음이거나 파일이 바뀐 경우에만 loader로 다시 읽음
+        다시 읽는 중에 파일이 없거나 형식이 잘못된 경우 (파일을 쓰는 중인 경우 등) 이전 key를 계속 사용
+
+        Args:
+            path (str): PEM 파일의 경로
+            loader (Callable): PEM 파일의 내용을 key 객체로 변환하는 함수
 
-    # private_key.pem 읽기
-    with open('private_key.pem', 'rb') as key_file:
-        private_key = serialization.load_pem_private_key(
-            key_file.read(), password=None, backend=default_backend())
+        Returns:
+            PUBLIC_KEY_TYPES, PRIVATE_KEY_TYPES: key 객체
+        """
 
-    return public_key, private_key
+        path = os.path.abspath(path)
+        now = time.monotonic()
+        entry = self.entries.get(path)
+
+        if entry and now - entry[2] < self.check_interval:
+            return entry[0]
+
+        with self.lock:
+            entry = self.entries.get(path)
+
+            try:
+                stat = os.stat(path)
+                signature = stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+                if entry and entry[1] == signature:
+                    entry[2] = now
+                    return entry[0]
+
+                with open(path, 'rb') as key_file:
+                    key = loader(key_file.read())
+            except (OSError, ValueError):
+                if entry is None:
+                    raise
+
+                entry[2] = now
+                return entry[0]
+
+            self.entries[path] = [key, signature, now]
+            self.loads += 1
+
+            return key
+
+    def public_key(self, path: str = 'public_key.pem'):
+        return self.load(path, load_public_key)
+
+    def private_key(self, path: str = 'private_key.pem'):
+        return self.load(path, load_private_key)
+
+    def read_keys(self, public_path: str = 'public_key.pem', private_path: str = 'private_key.pem'):
+        """
+        read_keys()와 같은 형식으로 보관 중인 key 객체를 반환
+
+        Returns:
+            PUBLIC_KEY_TYPES, PRIVATE_KEY_TYPES : 각 키 파일을 읽은 값
+        """
+
+        return self.public_key(public_path), self.private_key(private_path)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# 프로그램 전체에서 공유하는 key 저장소
+registry = KeyRegistry()
 
 
 def convert_to_bytes(text):
@@ -101,20 +228,160 @@ def convert_rsa(text, key, is_encrypt: bool = True):
         _type_: _description_
     """
 
-    # OAEP 객체 생성
-    oaep = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                        algorithm=hashes.SHA256(),
-                        label=None)
-
     # bytes 형식으로 사용
     text = convert_to_bytes(text)
 
     # 암호화
     if is_encrypt:
-        return key.encrypt(text, oaep)
+        return key.encrypt(text, OAEP)
 
     # 복호화
-    return key.decrypt(text, oaep)
+    return key.decrypt(text, OAEP)
+
+
+def read_full(src, size: int):
+    """
+    src에서 size bytes를 읽음, pipe나 socket처럼 한 번에 덜 읽히는 경우에도 끝까지 읽음
+
+    Args:
+        src (BinaryIO): 읽을 stream
+        size (int): 읽을 크기
+
+    Returns:
+        bytes: 읽은 값 (stream이 끝나면 size보다 짧음)
+    """
+
+    data = src.read(size)
+
+    while len(data) < size:
+        more = src.read(size - len(data))
+
+        if not more:
+            break
+
+        data += more
+
+    return data
+
+
+def encrypt_stream(src, dst, public_key, chunk_size: int = CHUNK_SIZE):
+    """
+    src의 내용을 chunk_size 단위로 읽어 암호화한 후 dst에 기록하는 함수
+    stream마다 새로운 AES key를 만들어 RSA-OAEP로 한 번만 암호화하고,
+    각 chunk는 AES-GCM으로 암호화하므로 메시지의 크기와 관계 없이 chunk 두 개 만큼의 메모리만 사용함
+
+    Args:
+        src (BinaryIO): 평문을 읽을 stream
+        dst (BinaryIO): 암호문을 기록할 stream
+        public_key (PUBLIC_KEY_TYPES): 수신자의 public_key
+        chunk_size (int, optional): chunk의 평문 크기
+
+    Returns:
+        int: 암호화한 평문의 크기
+    """
+
+    if not 0 < chunk_size < CHUNK_FINAL - TAG_SIZE:
+        raise ValueError(f'잘못된 chunk 크기: {chunk_size}')
+
+    aes_key = AESGCM.generate_key(bit_length=256)
+    aesgcm = AESGCM(aes_key)
+    enc_key = convert_rsa(aes_key, public_key)
+
+    dst.write(STREAM_HEADER.pack(STREAM_MAGIC, len(enc_key), chunk_size))
+    dst.write(enc_key)
+
+    total = 0
+    index = 0
+    chunk = read_full(src, chunk_size)
+
+    while True:
+        # 다음 chunk를 미리 읽어 현재 chunk가 마지막인지 확인
+        next_chunk = read_full(src, chunk_size) if len(chunk) == chunk_size else b''
+        final = not next_chunk
+
+        # 마지막 chunk 여부를 인증 데이터에 포함하여 stream이 잘린 경우를 검출
+        encrypted = aesgcm.encrypt(NONCE.pack(index), chunk, b'\x01' if final else b'\x00')
+        dst.write(CHUNK_HEADER.pack(len(encrypted) | (CHUNK_FINAL if final else 0)))
+        dst.write(encrypted)
+
+        total += len(chunk)
+        index += 1
+
+        if final:
+            return total
+
+        chunk = next_chunk
+
+
+def decrypt_stream(src, dst, private_key):
+    """
+    encrypt_stream()으로 암호화한 src를 chunk 단위로 복호화한 후 dst에 기록하는 함수
+    chunk가 변조되거나 순서가 바뀌면 cryptography.exceptions.InvalidTag가 발생함
+
+    Args:
+        src (BinaryIO): 암호문을 읽을 stream
+        dst (BinaryIO): 평문을 기록할 stream
+        private_key (PRIVATE_KEY_TYPES): 수신자의 private_key
+
+    Raises:
+        ValueError: 형식이 잘못되었거나, stream이 중간에 잘리거나, 마지막 chunk 뒤에 데이터가 있는 경우
+
+    Returns:
+        int: 복호화한 평문의 크기
+    """
+
+    header = read_full(src, STREAM_HEADER.size)
+
+    if len(header) < STREAM_HEADER.size:
+        raise ValueError('stream 암호문의 header가 잘림')
+
+    magic, key_size, chunk_size = STREAM_HEADER.unpack(header)
+
+    if magic != STREAM_MAGIC:
+        raise ValueError('stream 암호문의 형식이 아님')
+
+    enc_key = read_full(src, key_size)
+
+    if len(enc_key) < key_size:
+        raise ValueError('암호화된 AES key가 잘림')
+
+    aesgcm = AESGCM(convert_rsa(enc_key, private_key, False))
+
+    total = 0
+    index = 0
+
+    while True:
+        length = read_full(src, CHUNK_HEADER.size)
+
+        if len(length) < CHUNK_HEADER.size:
+            raise ValueError(f'{index}번째 chunk 전에 stream이 끝남')
+
+        length, = CHUNK_HEADER.unpack(length)
+        final = bool(length & CHUNK_FINAL)
+        length &= ~CHUNK_FINAL
+
+        # header의 chunk 크기보다 큰 chunk는 읽지 않음 (메모리 사용량 제한)
+        if length > chunk_size + TAG_SIZE:
+            raise ValueError(f'{index}번째 chunk의 크기가 너무 큼: {length}')
+
+        encrypted = read_full(src, length)
+
+        if len(encrypted) < length:
+            raise ValueError(f'{index}번째 chunk가 잘림')
+
+        chunk = aesgcm.decrypt(NONCE.pack(index), encrypted, b'\x01' if final else b'\x00')
+        dst.write(chunk)
+
+        total += len(chunk)
+        index += 1
+
+        if final:
+            break
+
+    if src.read(1):
+        raise ValueError('마지막 chunk 뒤에 데이터가 있음')
+
+    return total
 
 
 if __name__ == '__main__':
@@ -122,7 +389,7 @@ if __name__ == '__main__':
     # plain_text = input('평문 입력 : ')
     plain_text = 'hello'
 
-    # key 가져오기
+    # key 가져오기 (한 번 읽은 key는 registry에 보관)
     public_key, private_key = read_keys()
     aes_key = Fernet.generate_key()
 
@@ -150,3 +417,12 @@ if __name__ == '__main__':
         decrypted_text = convert_rsa(enc_msg, private_key, False)
 
     print(plain_text == decrypted_text.decode())
+
+    # 큰 메시지는 stream 방식으로 chunk 단위로 암호화/복호화한다.
+    payload = bytes(range(256)) * 4096
+    encrypted, decrypted = io.BytesIO(), io.BytesIO()
+    encrypt_stream(io.BytesIO(payload), encrypted, public_key)
+    encrypted.seek(0)
+    decrypt_stream(encrypted, decrypted, private_key)
+
+    print(payload == decrypted.getvalue(), f'{len(payload)} bytes -> {len(encrypted.getvalue())} bytes')
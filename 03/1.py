@@ -2,15 +2,25 @@ import os
 import random
 import time
 import hashlib
+import hmac
+import queue
 import secrets
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# 저장소의 최상위 디렉토리에 있는 eccore 패키지를 사용
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import eccore as ec
 
 # Alice는 타원 곡선 Ep(a, b)를 선택한다. 여기서 p는 소수이다.
-p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+p = ec.P
 # Alice는 곡선 상의 한 점 e1(…, …) 를 선택한다. <- generator
-e1 = (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
-      0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
+e1 = ec.G
 # Alice는 계산에 사용할 다른 소수 q를 선택한다.
-q = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+q = ec.N
 
 
 def h(M: str):
@@ -27,158 +37,225 @@ def h(M: str):
     return int(hashlib.sha256(M.encode()).hexdigest(), 16)
 
 
-class ec:
-    def extended_euclidian(n, b):
-        """
-        Extended Euclidian 알고리즘
-        곱셈에 대한 역원을 구하기 위해 사용함
+def sign(M: str, d: int):
+    """
+    전자서명 함수
 
-        Args:
-            n (Any): gcd(n, b)에서의 n
-            b (Any): gcd(n, b)에서의 b
+    Args:
+        M (str): 서명하고자 하는 메시지
+        d (int): 개인키
 
-        Returns:
-            Any: 곱셈에 대한 역원
-        """
+    Returns:
+        tuple: 개인키를 통해 메시지를 서명한 전자서명 S1, S2
+    """
 
-        # r1 <- n; r2 <- b; t1 <- 0; t2 <- 1;
-        r1, r2, t1, t2 = n, b % n, 0, 1
+    # Alice는 타원 곡선 E_p(a, b)를 선택한다. 여기서 p는 소수이다.
+    # Y^2 mod p = (x^3 + ax + b) mod p
+    a, b = [random.randint(1, 100) for _ in range(2)]
 
-        while r2 > 0:
-            # q <- r1 / r2;
-            q = r1 // r2
+    # Alice는 임의의 수 r을 선택한다. 1 < r < q – 1
+    r = secrets.randbelow(q - 1) + 1
 
-            # r <- r1 - q * r2;
-            r = r1 - q * r2
-            # r1 <- r2; r2 <- r;
-            r1, r2 = r2, r
-            # t <- t1 + q * t2;
-            t = t1 - q * t2
-            # t1 <- t2; t2 <- t;
-            t1, t2 = t2, t
+    # 곡선 상의 한점 P(u, v) = r × e1 (…, …)을 계산한 후,
+    u, _ = ec.multiply_generator(r)
+    # S_1 = u mod q를 기억
+    S1 = u % q
 
-        return t1 % n
+    # S_2 = (h(M) + d × S_1) × r^−1 mod q 를 계산
+    S2 = (h(M) + d * S1) * ec.extended_euclidian(q, r) % q
 
-    def add(a: tuple, b: tuple):
-        """
-        타원 곡선 상의 덧셈 연산
+    # (S1, S2)가 메시지 M의 서명
+    return S1, S2
 
-        Args:
-            p (tuple): 타원 곡선 상의 두 점 중 P
-            q (tuple): 타원 곡선 상의 두 점 중 Q
 
-        Returns:
-            tuple: 타원 곡선 상의 덧셈 결과
-        """
+def verify(M, S1, S2, e2):
+    """
+    전자서명이 일치하는지 확인하는 함수
+
+    Args:
+        M (str): 검증하고자 하는 메시지
+        S1 (int): sign()을 통해 생성된 전자서명 S1
+        S2 (int): sign()을 통해 생성된 전자서명 S2
+        e2 (tuple): 공개키
+
+    Returns:
+        bool: 메시지의 내용과 전자서명이 일치하는지에 대한 여부
+    """
+
+    # 서명 값은 1 이상 q 미만이어야 함
+    if not (0 < S1 < q and 0 < S2 < q):
+        return False
+
+    # Bob은 M, S1, S2를 이용하여 두 개의 중간 결과 A와 B를 계산
+
+    # tmp = S_2^−1 mod q
+    tmp = ec.extended_euclidian(q, S2) % q
+    # A = h(M) × S_2^−1 mod q
+    A = h(M) * tmp % q
+    # B = S_1 × S_2^-1 mod q
+    B = S1 * tmp % q
 
-        tmp = None
+    # T(x, y) = A × e1 (…, …) + B × e2 (…, …)
+    # 두 스칼라 곱셈을 하나의 loop에서 함께 계산
+    T = ec.multiply_two(A, e1, B, e2)
 
-        if a == b:
-            # b의 경우: λ = (3x1^2 + a)/(2y1)
-            tmp = ((3 * a[0] * a[0]) * ec.extended_euclidian(p, 2 * b[1])) % p
-        else:
-            # a의 경우, P와 Q를 지나는 직선의 방정식
-            tmp = ((b[1] - a[1]) * ec.extended_euclidian(p, b[0] - a[0])) % p
+    # 프로그램의 검증을 위해 A와 B의 내용을 출력한다.
+    print(f'\tA = {hex(A)}')
+    print(f'\tB = {hex(B)}')
 
-        x = (tmp ** 2 - a[0] - b[0]) % p
-        y = (tmp * (a[0] - x) - a[1]) % p
+    # T가 무한원점이 아니고 x mod q == S1 mod q일 경우, 검증 완료
+    return T is not None and T[0] % q == S1 % q
 
-        return x, y
 
-    def double_and_add(x: int, g: tuple):
+class PublicKeyCache:
+    """
+    공개키별로 고정점 테이블을 보관하는 LRU cache
+    같은 공개키로 반복하여 검증하는 경우 B × e2를 2배 연산 없이 테이블의 덧셈만으로 계산
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.tables: OrderedDict = OrderedDict()
+
+    def table_size(self, table: list):
         """
-        Double-and-Add 알고리즘
-        공개키를 만들기 위해 G를 x번 더하는 연산이 필요
-        개인키가 x라고 하면 공개 키는 x * G의 결과로 생성됨
+        테이블이 차지하는 메모리의 크기를 계산
 
         Args:
-            x (int): 개인키 (256 bit)
-            g (tuple): 타원 곡선 상의 고정된 점 (공개)
+            table (list): 고정점 테이블
 
         Returns:
-            tuple: x * g의 결과 값
+            int: 메모리 크기 (bytes)
         """
 
-        binary = bin(x)[3:]
-        result = g[0], g[1]
+        size = sys.getsizeof(table)
 
-        # left-to-right로 k의 비트를 조사
-        for i in range(len(binary)):
-            # Double만 적용
-            result = ec.add(result, result)
+        for row in table:
+            size += sys.getsizeof(row)
 
-            if binary[i] == '1':
-                # Double(2배 연산)을 적용한 후 Add(G를 더함)
-                result = ec.add(result, g)
+            for point in row:
+                size += sys.getsizeof(point) + sys.getsizeof(point[0]) + sys.getsizeof(point[1])
 
-        return result
+        return size
 
-    def generate_public_key(d: int):
+    def get(self, e2: tuple):
         """
-        개인키를 통해 공개키를 생성
+        공개키의 고정점 테이블을 반환, cache에 없으면 새로 계산하여 저장
+        저장 공간이 부족하면 가장 오래 사용하지 않은 테이블부터 제거
 
         Args:
-            d (int): 개인키
+            e2 (tuple): 공개키
 
         Returns:
-            tuple: e1을 key 만큼 곱한 공개키
+            list: e2의 고정점 테이블
         """
 
-        return ec.double_and_add(d, e1)
+        if e2 in self.tables:
+            self.hits += 1
+            self.tables.move_to_end(e2)
+            return self.tables[e2][0]
 
-    def generate_private_key():
-        """
-        256비트의 난수를 생성하고, 이를 개인키로 이용하기 위한 함수
+        self.misses += 1
+        table = ec.build_fixed_base_table(e2)
+        size = self.table_size(table)
 
-        Returns:
-            int: 256비트 난수 개인키
-        """
+        # cache 전체보다 큰 테이블은 저장하지 않음
+        if size > self.max_bytes:
+            return table
 
-        while True:
-            # 개인키의 randomness를 강화하기 위하여 os.urandom()과 random.random(), 그리고 time.time()을 모두 적용한 문자열을 생성
-            text = f'{os.urandom(16).hex()}{random.random()}{time.time()}'
-            # hashlib.sha256() 함수를 이용하여 256비트의 난수를 생성
-            key = int(hashlib.sha256(text.encode()).hexdigest(), 16)
+        while self.size + size > self.max_bytes:
+            _, (_, evicted) = self.tables.popitem(last=False)
+            self.size -= evicted
+            self.evictions += 1
 
-            # SECP256K1 곡선의 q보다 작으면 개인키로 사용하고, 아니면 또 다른 난수를 다시 생성
-            if q > key:
-                return key
+        self.tables[e2] = table, size
+        self.size += size
 
+        return table
 
-def sign(M: str, d: int):
+    def clear(self):
+        self.tables.clear()
+        self.size = 0
+
+    def __len__(self):
+        return len(self.tables)
+
+    def __contains__(self, e2):
+        return e2 in self.tables
+
+    def __repr__(self):
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+
+        return f'키의 수 = {len(self.tables)}, 메모리 = {self.size}/{self.max_bytes} bytes\n' \
+            f'hit = {self.hits}, miss = {self.misses}, eviction = {self.evictions}, hit ratio = {ratio:.3f}'
+
+
+# 공개키 cache, PublicKeyCache 객체를 지정하면 verify_fast()와 verify_batch()에서 사용함
+# 고정점 테이블은 pure Python으로 계산하므로 coincurve와 같은 native backend에서는 사용하지 않음
+public_key_cache: PublicKeyCache = None
+
+
+def verification_point(A: int, B: int, e2: tuple):
     """
-    전자서명 함수
+    검증에 사용하는 점 T = A × e1 + B × e2를 Jacobian 좌표로 계산
+    public_key_cache가 지정되어 있고 backend가 native가 아니면 e1과 e2 모두 고정점 테이블을 이용하고,
+    아니면 eccore의 backend를 이용
 
     Args:
-        M (str): 서명하고자 하는 메시지
-        d (int): 개인키
+        A (int): h(M) × S_2^−1 mod q
+        B (int): S_1 × S_2^-1 mod q
+        e2 (tuple): 공개키
 
     Returns:
-        tuple: 개인키를 통해 메시지를 서명한 전자서명 S1, S2
+        tuple: T의 Jacobian 좌표 (무한원점이면 Z = 0)
     """
 
-    # Alice는 타원 곡선 E_p(a, b)를 선택한다. 여기서 p는 소수이다.
-    # Y^2 mod p = (x^3 + ax + b) mod p
-    a, b = [random.randint(1, 100) for _ in range(2)]
+    if public_key_cache is None or ec.backend.NATIVE:
+        return ec.multiply_two_jacobian(A, e1, B, e2)
 
-    # Alice는 임의의 수 r을 선택한다. 1 < r < q – 1
-    r = secrets.randbelow(q - 1) + 1
+    # 무한원점 (None)이나 곡선 상의 점이 아닌 공개키는 테이블을 만들지 않고 backend와 같이 검증에 실패하도록 처리
+    if e2 is None or not ec.on_curve(e2):
+        return ec.INFINITY
 
-    # 곡선 상의 한점 P(u, v) = r × e1 (…, …)을 계산한 후,
-    u, _ = ec.double_and_add(r, e1)
-    # S_1 = u mod q를 기억
-    S1 = u % q
+    return ec.jacobian_add(ec.jacobian_fixed_base_double_and_add(A),
+                           ec.jacobian_fixed_base_double_and_add(B, public_key_cache.get(e2)))
 
-    # S_2 = (h(M) + d × S_1) × r^−1 mod q 를 계산
-    S2 = (h(M) + d * S1) * ec.extended_euclidian(q, r) % q
 
-    # (S1, S2)가 메시지 M의 서명
-    return S1, S2
+def matches(T: tuple, S1: int):
+    """
+    T의 x 좌표 mod q가 S1과 같은지 Jacobian 좌표 그대로 비교하여 역원 계산을 생략
 
+    Args:
+        T (tuple): verification_point()의 결과
+        S1 (int): 전자서명 S1
 
-def verify(M, S1, S2, e2):
+    Returns:
+        bool: x mod q == S1인지에 대한 여부
     """
-    전자서명이 일치하는지 확인하는 함수
+
+    X, _, Z = T
+
+    if Z == 0:
+        return False
+
+    # x = X / Z^2 이므로, x mod q == S1 이려면 x = S1 또는 x = S1 + q (< p)
+    zz = Z * Z % p
+    return X == S1 * zz % p or (S1 + q < p and X == (S1 + q) * zz % p)
+
+
+# verify_fast()의 호출 횟수, 검증에 성공한 횟수, 누적 실행 시간(초)
+verify_stats = {'calls': 0, 'valid': 0, 'seconds': 0.0}
+
+
+def verify_fast(M, S1, S2, e2):
+    """
+    대량의 전자서명을 검증하기 위한 함수
+    verify()와 달리 A와 B를 출력하지 않으며, 호출 횟수와 실행 시간을 verify_stats에 누적함
 
     Args:
         M (str): 검증하고자 하는 메시지
@@ -190,24 +267,275 @@ def verify(M, S1, S2, e2):
         bool: 메시지의 내용과 전자서명이 일치하는지에 대한 여부
     """
 
-    # Bob은 M, S1, S2를 이용하여 두 개의 중간 결과 A와 B를 계산
+    start = time.perf_counter()
+    valid = False
 
-    # tmp = S_2^−1 mod q
-    tmp = ec.extended_euclidian(q, S2) % q
-    # A = h(M) × S_2^−1 mod q
-    A = h(M) * tmp
-    # B = S_1 × S_2^-1 mod q
-    B = S1 * tmp
+    # 서명 값은 1 이상 q 미만이어야 함
+    if 0 < S1 < q and 0 < S2 < q:
+        tmp = ec.extended_euclidian(q, S2)
+        valid = matches(verification_point(h(M) * tmp % q, S1 * tmp % q, e2), S1)
 
-    # T(x, y) = A × e1 (…, …) + B × e2 (…, …)
-    x, _ = ec.add(ec.double_and_add(A, e1), ec.double_and_add(B, e2))
+    verify_stats['calls'] += 1
+    verify_stats['valid'] += valid
+    verify_stats['seconds'] += time.perf_counter() - start
 
-    # 프로그램의 검증을 위해 A와 B의 내용을 출력한다.
-    print(f'\tA = {hex(A)}')
-    print(f'\tB = {hex(B)}')
+    return valid
+
+
+def verify_chunk(items: list):
+    """
+    여러 개의 전자서명을 한 번에 검증하는 함수
+    S2의 역원은 Montgomery의 trick으로 한 번에 계산하고,
+    T의 x 좌표는 Jacobian 좌표 그대로 비교하여 역원 계산을 생략함
+
+    Args:
+        items (list): (M, S1, S2, e2) 목록
+
+    Returns:
+        list: 각 전자서명의 검증 결과
+    """
+
+    results = [False] * len(items)
+    # 서명 값이 1 이상 q 미만인 항목만 검증
+    index = [i for i, (_, S1, S2, _) in enumerate(items) if 0 < S1 < q and 0 < S2 < q]
+
+    if not index:
+        return results
+
+    invs = ec.batch_inverse([items[i][2] for i in index], q)
+
+    for i, tmp in zip(index, invs):
+        M, S1, _, e2 = items[i]
+        results[i] = matches(verification_point(h(M) * tmp % q, S1 * tmp % q, e2), S1)
+
+    return results
+
+
+def verify_batch(items: list, workers: int = None, chunk_size: int = 256):
+    """
+    대량의 전자서명을 여러 프로세스에서 나누어 검증하는 함수
+    public_key_cache는 현재 프로세스에만 있으므로, cache를 사용하는 경우에는 현재 프로세스에서만 검증함
+    (다른 프로세스에서 채운 테이블과 hit/miss는 현재 프로세스의 cache에 반영되지 않음)
+
+    Args:
+        items (list): (M, S1, S2, e2) 목록
+        workers (int, optional): 사용할 프로세스의 수, None이면 CPU 개수 (cache를 사용하면 1),
+            1이면 현재 프로세스에서 검증
+        chunk_size (int, optional): 하나의 프로세스에 한 번에 전달할 전자서명의 수
+
+    Raises:
+        ValueError: cache를 사용하면서 workers를 2 이상으로 지정한 경우
+
+    Returns:
+        list: 각 전자서명의 검증 결과 (items와 같은 순서)
+    """
+
+    if public_key_cache is not None and not ec.backend.NATIVE:
+        if workers not in (None, 1):
+            raise ValueError('public_key_cache를 사용하는 경우 workers는 1이어야 함')
+
+        workers = 1
+
+    items = list(items)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        return [r for chunk in chunks for r in verify_chunk(chunk)]
+
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_results in executor.map(verify_chunk, chunks):
+            results.extend(chunk_results)
+
+    return results
+
+
+def rfc6979_nonces(d: int, z: int):
+    """
+    RFC 6979의 결정적(deterministic) nonce 생성 (HMAC-SHA256)
+    같은 개인키와 메시지에 대해 항상 같은 r을 차례대로 생성함
+
+    Args:
+        d (int): 개인키
+        z (int): 메시지의 hash 값 h(M)
+
+    Yields:
+        int: 1 이상 q 미만의 nonce r
+    """
+
+    x = d.to_bytes(32, 'big')
+    z = (z % q).to_bytes(32, 'big')
+
+    # 3.2. b. ~ g.
+    V = b'\x01' * 32
+    K = b'\x00' * 32
+    K = hmac.new(K, V + b'\x00' + x + z, hashlib.sha256).digest()
+    V = hmac.new(K, V, hashlib.sha256).digest()
+    K = hmac.new(K, V + b'\x01' + x + z, hashlib.sha256).digest()
+    V = hmac.new(K, V, hashlib.sha256).digest()
+
+    # 3.2. h. q가 256비트이므로 V 하나가 후보가 됨, 범위를 벗어나거나 서명에 실패하면 다음 후보를 생성
+    while True:
+        V = hmac.new(K, V, hashlib.sha256).digest()
+        r = int.from_bytes(V, 'big')
+
+        if 0 < r < q:
+            yield r
+
+        K = hmac.new(K, V + b'\x00', hashlib.sha256).digest()
+        V = hmac.new(K, V, hashlib.sha256).digest()
+
+
+def precompute_nonces(count: int):
+    """
+    메시지와 관계 없는 서명의 앞부분 (r, r^-1 mod q, S1)을 미리 계산
+    r × e1은 multiply_generator_many()로, r^-1은 Montgomery의 trick으로 한 번에 계산
+
+    Args:
+        count (int): 계산할 nonce의 수
+
+    Returns:
+        list: (r, r^-1 mod q, S1) 목록
+    """
+
+    rs = [secrets.randbelow(q - 1) + 1 for _ in range(count)]
+    points = ec.multiply_generator_many(rs)
+
+    # S1 = u mod q가 0이면 서명에 사용할 수 없으므로 제외
+    return [(r, r_inv, u % q) for r, r_inv, (u, _) in zip(rs, ec.batch_inverse(rs, q), points) if u % q]
+
+
+class Signer:
+    """
+    하나의 개인키로 반복하여 서명하기 위한 객체
+    sign()에서 대부분의 시간을 차지하는 r × e1은 메시지와 관계가 없으므로,
+    background thread가 (r, r^-1 mod q, S1)을 미리 계산하여 pool에 채워 두고
+    sign()은 hash와 몇 번의 곱셈만으로 서명함
+    deterministic이 True이면 pool을 사용하지 않고 RFC 6979로 r을 생성
+    """
+
+    def __init__(self, d: int, pool_size: int = 256, batch_size: int = 32,
+                 workers: int = 0, deterministic: bool = False):
+        """
+        Args:
+            d (int): 개인키
+            pool_size (int, optional): pool에 보관할 nonce의 최대 개수
+            batch_size (int, optional): 한 번에 미리 계산할 nonce의 수
+            workers (int, optional): 미리 계산에 사용할 프로세스의 수, 0이면 background thread에서 직접 계산
+            deterministic (bool, optional): RFC 6979 결정적 nonce를 사용할지에 대한 여부
+        """
+
+        self.d = d
+        self.deterministic = deterministic
+        self.batch_size = batch_size
+        # pool에서 가져온 횟수
+        self.hits = 0
+        # pool이 비어 있어 sign()에서 직접 계산한 횟수
+        self.misses = 0
+
+        self.pool: queue.Queue = queue.Queue(pool_size)
+        self.stopped = threading.Event()
+        self.executor = ProcessPoolExecutor(workers) if workers and not deterministic else None
+        self.thread = None
+
+        if not deterministic:
+            self.thread = threading.Thread(target=self.fill, daemon=True)
+            self.thread.start()
+
+    def fill(self):
+        """
+        background thread에서 pool이 가득 찰 때까지 nonce를 계속 채움
+        workers를 지정한 경우 계산은 다른 프로세스에서 수행하므로 서명하는 thread가 GIL을 기다리지 않음
+        """
+
+        while not self.stopped.is_set():
+            if self.executor:
+                nonces = self.executor.submit(precompute_nonces, self.batch_size).result()
+            else:
+                nonces = precompute_nonces(self.batch_size)
+
+            for nonce in nonces:
+                # pool이 가득 차 있으면 자리가 생길 때까지 대기 (close()를 확인하기 위해 주기적으로 깨어남)
+                while not self.stopped.is_set():
+                    try:
+                        self.pool.put(nonce, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+
+    def nonces(self, z: int):
+        """
+        서명에 사용할 (r, r^-1 mod q, S1)을 차례대로 생성
+
+        Args:
+            z (int): 메시지의 hash 값 h(M)
+
+        Yields:
+            tuple: (r, r^-1 mod q, S1)
+        """
+
+        if self.deterministic:
+            for r in rfc6979_nonces(self.d, z):
+                u, _ = ec.multiply_generator(r)
+                yield r, ec.extended_euclidian(q, r), u % q
+            return
+
+        while True:
+            try:
+                nonces = [self.pool.get_nowait()]
+                self.hits += 1
+            except queue.Empty:
+                # pool이 비어 있으면 기다리지 않고 직접 계산
+                nonces = precompute_nonces(1)
+                self.misses += 1
+
+            yield from nonces
+
+    def sign(self, M: str):
+        """
+        전자서명 함수, sign(M, d)와 같은 형식의 전자서명을 생성
+
+        Args:
+            M (str): 서명하고자 하는 메시지
+
+        Returns:
+            tuple: 개인키를 통해 메시지를 서명한 전자서명 S1, S2
+        """
+
+        z = h(M)
+
+        for _, r_inv, S1 in self.nonces(z):
+            if not S1:
+                continue
+
+            # S_2 = (h(M) + d × S_1) × r^−1 mod q
+            S2 = (z + self.d * S1) * r_inv % q
+
+            if S2:
+                return S1, S2
+
+    def close(self):
+        """
+        background thread와 프로세스를 종료
+        """
+
+        self.stopped.set()
+
+        if self.thread:
+            self.thread.join()
+        if self.executor:
+            self.executor.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
-    # x mod q == S1 mod q일 경우, 검증 완료
-    return x % q == S1 % q
+    def __repr__(self):
+        return f'pool = {self.pool.qsize()}/{self.pool.maxsize}, hit = {self.hits}, miss = {self.misses}, ' \
+            f'deterministic = {self.deterministic}'
 
 
 if __name__ == '__main__':
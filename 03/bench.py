@@ -0,0 +1,59 @@
+import os
+import time
+import importlib
+
+# 같은 디렉토리의 1.py (전자서명 예제)
+ecdsa = importlib.import_module('1')
+
+# 벤치마크에 사용할 전자서명의 수
+COUNT = 2048
+# 비교할 batch(chunk) 크기와 프로세스 수
+BATCH_SIZES = [16, 64, 256, 1024]
+WORKERS = sorted({1, 2, 4, os.cpu_count() or 1})
+
+
+def make_items(count: int, keys: int = 8):
+    """
+    벤치마크에 사용할 (M, S1, S2, e2) 목록을 생성
+
+    Args:
+        count (int): 생성할 전자서명의 수
+        keys (int, optional): 사용할 키 쌍의 수
+
+    Returns:
+        list: (M, S1, S2, e2) 목록
+    """
+
+    pairs = []
+
+    for _ in range(keys):
+        d = ecdsa.ec.generate_private_key()
+        pairs.append((d, ecdsa.ec.generate_public_key(d)))
+
+    items = []
+
+    for i in range(count):
+        d, e2 = pairs[i % keys]
+        M = f'message {i}'
+        items.append((M, *ecdsa.sign(M, d), e2))
+
+    return items
+
+
+if __name__ == '__main__':
+    items = make_items(COUNT)
+
+    # 기준: verify_fast()를 하나씩 호출
+    start = time.perf_counter()
+    assert all(ecdsa.verify_fast(*item) for item in items)
+    base = COUNT / (time.perf_counter() - start)
+    print(f'verify_fast loop: {base:10.1f} sig/s')
+    print()
+
+    print(f'{"batch":>6} {"workers":>8} {"sig/s":>12} {"speedup":>8}')
+    for chunk_size in BATCH_SIZES:
+        for workers in WORKERS:
+            start = time.perf_counter()
+            assert all(ecdsa.verify_batch(items, workers, chunk_size))
+            rate = COUNT / (time.perf_counter() - start)
+            print(f'{chunk_size:>6} {workers:>8} {rate:>12.1f} {rate / base:>7.2f}x')
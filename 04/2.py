@@ -1,185 +1,205 @@
-import hashlib
-import base58check
+import os
+import sys
 import time
 import datetime
-import random
-from Crypto.Hash import RIPEMD160
+import secrets
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
-# Alice는 타원 곡선 Ep(a, b)를 선택한다. 여기서 p는 소수이다.
-p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
-# Alice는 곡선 상의 한 점 e1(…, …) 를 선택한다. <- generator
-e1 = (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
-      0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
-# Alice는 계산에 사용할 다른 소수 q를 선택한다.
-q = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+# 저장소의 최상위 디렉토리에 있는 eccore 패키지를 사용
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
+# SECP256K1 타원 곡선의 고정된 점 G와 G의 위수 N, 그리고 Jacobian 좌표의 연산은 eccore.curve에 있음
+from eccore import G, N, to_jacobian, jacobian_add, jacobian_double_and_add, batch_from_jacobian
+# 공개키의 hash160과 binary 주소는 04/1.py와 같은 eccore.address의 함수를 사용
+from eccore.address import hash160, address_bytes, encode_addr
 
-def extended_euclidian(n, b):
+
+# Base58 인코딩에 사용하는 문자
+B58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+
+def prefix_ranges(target: str):
     """
-    Extended Euclidian 알고리즘
-    곱셈에 대한 역원을 구하기 위해 사용함
+    주소가 '1' + target으로 시작하기 위한 RIPEMD-160 hash 값의 범위를 계산
+    25 bytes의 주소(0x00 + hash + checksum)에서 첫 byte를 제외한 값 N을 Base58로 인코딩하면
+    주소의 두 번째 글자부터가 되므로, 인코딩된 길이마다 N의 범위를 구한 후 hash의 범위로 변환
+    target 앞의 '1'은 hash 앞부분의 0x00 byte를 의미함
 
     Args:
-        n (Any): gcd(n, b)에서의 n
-        b (Any): gcd(n, b)에서의 b
+        target (str): 희망하는 주소의 문자열
+
+    Raises:
+        ValueError: target에 Base58에서 사용하지 않는 문자가 있는 경우
 
     Returns:
-        Any: 곱셈에 대한 역원
+        list: hash를 정수로 보았을 때의 (최솟값, 최댓값) 목록
     """
 
-    # r1 <- n; r2 <- b; t1 <- 0; t2 <- 1;
-    r1, r2, t1, t2 = n, b % n, 0, 1
+    for ch in target:
+        if ch not in B58_ALPHABET:
+            raise ValueError(f'Base58에서 사용하지 않는 문자: {ch}')
 
-    while r2 > 0:
-        # q <- r1 / r2;
-        q = r1 // r2
+    body = target.lstrip('1')
+    zeros = len(target) - len(body)
 
-        # r <- r1 - q * r2;
-        r = r1 - q * r2
-        # r1 <- r2; r2 <- r;
-        r1, r2 = r2, r
-        # t <- t1 + q * t2;
-        t = t1 - q * t2
-        # t1 <- t2; t2 <- t;
-        t1, t2 = t2, t
+    # N은 24 bytes, 앞의 zeros bytes가 0이어야 하고, body가 있으면 그 다음 byte는 0이 아니어야 함
+    top = 256 ** (24 - zeros)
 
-    return t1 % n
+    if not body:
+        return [(0, (top - 1) >> 32)] if zeros < 24 else []
 
+    bottom = 256 ** (23 - zeros)
+    value = 0
 
-def add(a: tuple, b: tuple):
-    """
-    타원 곡선 상의 덧셈 연산
+    for ch in body:
+        value = value * 58 + B58_ALPHABET.index(ch)
 
-    Args:
-        p (tuple): 타원 곡선 상의 두 점 중 P
-        q (tuple): 타원 곡선 상의 두 점 중 Q
+    ranges = []
+    scale = 1
 
-    Returns:
-        tuple: 타원 곡선 상의 덧셈 결과
-    """
+    # N을 인코딩한 길이가 len(body), len(body) + 1, ...인 경우를 차례로 조사
+    while value * scale < top:
+        lo = max(value * scale, bottom)
+        hi = min((value + 1) * scale, top)
+
+        if lo < hi:
+            # checksum 4 bytes를 제외한 hash의 범위 (경계의 hash는 주소를 만들어 다시 확인)
+            ranges.append((lo >> 32, (hi - 1) >> 32))
+
+        scale *= 58
+
+    return ranges
+
+
+# 하나의 worker가 한 번에 affine 좌표로 변환하는 후보 키의 수
+SEARCH_BLOCK = 1024
 
-    tmp = None
+# worker 프로세스에서 공유하는 중단 신호와 검사한 키의 수
+_stop = None
+_counter = None
 
-    if a == b:
-        # b의 경우: λ = (3x1^2 + a)/(2y1)
-        tmp = ((3 * a[0] * a[0]) * extended_euclidian(p, 2 * b[1])) % p
-    else:
-        # a의 경우, P와 Q를 지나는 직선의 방정식
-        tmp = ((b[1] - a[1]) * extended_euclidian(p, b[0] - a[0])) % p
 
-    x = (tmp ** 2 - a[0] - b[0]) % p
-    y = (tmp * (a[0] - x) - a[1]) % p
+def init_search_worker(stop, counter):
+    """
+    worker 프로세스의 초기화 함수
+
+    Args:
+        stop (multiprocessing.Event): 주소를 찾았을 때 모든 worker를 중단시키기 위한 신호
+        counter (multiprocessing.Value): 모든 worker가 검사한 키의 수
+    """
 
-    return x, y
+    global _stop, _counter
+    _stop, _counter = stop, counter
 
 
-def double_and_add(x: int, g: tuple):
+def search_range(target: str, start: int):
     """
-    Double-and-Add 알고리즘
-    공개키를 만들기 위해 G를 x번 더하는 연산이 필요
-    개인키가 x라고 하면 공개 키는 x * G의 결과로 생성됨
+    start부터 개인키를 1씩 증가시키며 target으로 시작하는 주소를 탐색
+    k + 1의 공개키는 k의 공개키에 G를 한 번 더하여 구하고,
+    SEARCH_BLOCK개의 공개키를 한 번의 역원 계산으로 affine 좌표로 변환
 
     Args:
-        x (int): 개인키 (256 bit)
-        g (tuple): 타원 곡선 상의 고정된 점 (공개)
+        target (str): 희망하는 주소의 문자열
+        start (int): 탐색을 시작할 개인키
 
     Returns:
-        tuple: x * g의 결과 값
+        tuple: (개인키, 주소), 다른 worker가 먼저 찾아 중단된 경우 None
     """
 
-    binary = bin(x)[3:]
-    result = g[0], g[1]
+    ranges = prefix_ranges(target)
+    g = to_jacobian(G)
+    point = jacobian_double_and_add(start, g)
+    key = start
 
-    # left-to-right로 k의 비트를 조사
-    for i in range(len(binary)):
-        # Double만 적용
-        result = add(result, result)
+    while not _stop.is_set():
+        block = []
 
-        if binary[i] == '1':
-            # Double(2배 연산)을 적용한 후 Add(G를 더함)
-            result = add(result, g)
+        for _ in range(SEARCH_BLOCK):
+            block.append(point)
+            point = jacobian_add(point, g)
 
-    return result
+        for i, (x, y) in enumerate(batch_from_jacobian(block)):
+            h = int.from_bytes(hash160(x, y), 'big')
 
+            for lo, hi in ranges:
+                if lo <= h <= hi:
+                    # 범위에 포함되는 경우에만 Base58 인코딩을 수행하여 확인
+                    _, addr = encode_addr(address_bytes(x, y))
 
-def generate_public_key(d: int):
-    """
-    개인키를 통해 공개키를 생성
+                    if addr[1:].startswith(target):
+                        _stop.set()
+                        return (key + i) % N, addr
 
-    Args:
-        d (int): 개인키
+        key += SEARCH_BLOCK
 
-    Returns:
-        tuple: e1을 key 만큼 곱한 공개키
-    """
+        with _counter.get_lock():
+            _counter.value += SEARCH_BLOCK
 
-    return double_and_add(d, e1)
+    return None
 
 
-def generate_addr(private_key: int):
+def search(target: str, workers: int = None, interval: float = 1.0):
     """
-    압축 공개키를 이용하여 Public Key Hash를 생성하고, 
-    이를 이용하여 비트코인 주소를 출력
+    개인키 공간을 workers개로 나누어 여러 프로세스에서 target으로 시작하는 주소를 탐색
+    interval초마다 초당 검사한 키의 수와 예상 남은 시간을 출력
 
     Args:
-        private_key (int): 개인키
+        target (str): 희망하는 주소의 문자열
+        workers (int, optional): 사용할 프로세스의 수, None이면 CPU 개수
+        interval (float, optional): 진행 상황을 출력하는 주기 (초)
 
     Returns:
-        hash, address: 공개키의 Hash 값과, 비트코인 주소를 반환
+        tuple: (개인키, 주소, 검사한 키의 수)
     """
 
-    # 1. Take the corresponding public key generated with it
-    x, y = generate_public_key(private_key)
+    workers = workers or os.cpu_count() or 1
+    stop = multiprocessing.Event()
+    counter = multiprocessing.Value('Q', 0)
+
+    # 임의의 시작점으로부터 N을 workers개의 구간으로 나눔
+    base = secrets.randbelow(N - 1) + 1
+    stride = N // workers
+    # hash가 범위에 포함될 확률로부터 계산한 예상 시도 횟수
+    ranges = prefix_ranges(target)
+    expected = 2 ** 160 / max(sum(hi - lo + 1 for lo, hi in ranges), 1)
 
-    # (33 bytes, 1 byte 0x02 (y-coord is even), and 32 bytes corresponding to X coordinate)
-    hash = f'{"03" if y % 2 else "02"}{format(x, "x")}'
+    start = time.time()
+    result = None
 
-    try:
-        # 2. Perform SHA-256 hashing on the public key
-        hash = hashlib.sha256(bytes.fromhex(hash)).hexdigest()
-    except:
-        return ('', '')
+    with ProcessPoolExecutor(workers, initializer=init_search_worker, initargs=(stop, counter)) as executor:
+        futures = [executor.submit(search_range, target, (base + i * stride) % N or 1)
+                   for i in range(workers)]
 
-    # 3. Perform RIPEMD-160 hashing on the result of SHA-256
-    r = RIPEMD160.new()
-    r.update(bytes.fromhex(hash))
+        # 예외나 KeyboardInterrupt로 loop를 벗어나도 worker를 멈추어야 executor의 종료 대기가 끝남
+        try:
+            while result is None:
+                done, _ = wait(futures, timeout=interval, return_when=FIRST_COMPLETED)
 
-    # 4. Add version byte in front of RIPEMD-160 hash (0x00 for Main Network)
-    hash = f'00{r.hexdigest()}'
-    chk = hash
+                for future in done:
+                    result = result or future.result()
 
-    # 5. Perform SHA-256 hash on the extended RIPEMD-160 result
-    # 6. Perform SHA-256 hash on the result of the previous SHA-256 hash
-    for _ in range(2):
-        chk = hashlib.sha256(bytes.fromhex(chk)).hexdigest()
+                elapsed = time.time() - start
+                rate = counter.value / elapsed if elapsed else 0
+                # 각 키는 독립적인 시도이므로 이미 검사한 키의 수와 관계 없이 남은 시도 횟수의 기댓값은 expected
+                eta = expected / rate if rate else 0
+                print(f'\r{counter.value} keys, {rate:.0f} keys/s, '
+                      f'예상 남은 시간 {datetime.timedelta(seconds=int(eta))}', end='', flush=True)
+        finally:
+            stop.set()
 
-    # 7. Take the first 4 bytes of the second SHA-256 hash. This is the address checksum
-    # 8. Add the 4 checksum bytes from stage 7 at the end of extended RIPEMD-160 hash from stage 4. This is the 25-byte binary Bitcoin Address.
-    addr = f'{hash}{chk[:8]}'
+    print()
 
-    # 9. Convert the result from a byte string into a base58 string using Base58Check encoding. This is the most commonly used Bitcoin Address format
-    return hash, base58check.b58encode(bytes.fromhex(addr)).decode()
+    return result + (counter.value,)
 
 
 if __name__ == '__main__':
     target = input('희망하는 주소의 문자열? ')
 
-    private_key = None
-    addr = None
     start = time.time()
-    loops = 1
-
-    while True:
-        # 0. Having a private ECDSA key
-        private_key = random.getrandbits(256)
-
-        # 압축 공개키를 이용하여 Public Key Hash를 생성한 후, Base58Check 인코딩 방식의 주소를 출력한다.
-        hash, addr = generate_addr(private_key)
-
-        if addr[1:].startswith(target):
-            break
 
-        loops += 1
+    # 개인키를 1씩 증가시키며 여러 프로세스에서 주소를 탐색한다.
+    private_key, addr, loops = search(target)
 
     print(f'개인키 = {private_key}')
     print(f'주소 = {addr}')
@@ -0,0 +1,235 @@
+import os
+import sys
+import mmap
+import heapq
+import functools
+import contextlib
+
+# 저장소의 최상위 디렉토리에 있는 eccore 패키지를 사용
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from eccore import compress, decompress, multiply_generator_many
+# index에 저장하는 hash160은 04/1.py의 주소 생성과 같은 함수로 계산
+from eccore.address import key_hash160
+
+# 압축 공개키 하나의 크기 (1 byte 0x02/0x03 + x 좌표 32 bytes)
+KEY_SIZE = 33
+# index 항목 하나의 크기 (hash160 20 bytes + 키의 번호 8 bytes)
+INDEX_SIZE = 28
+# index 파일의 확장자
+INDEX_SUFFIX = '.idx'
+# build_index()에서 한 번에 메모리에 올려 정렬하는 항목의 수 (나머지는 정렬된 임시 파일로 나누어 병합)
+INDEX_RUN = 1 << 18
+# __main__에서 한 번에 계산하여 파일에 쓰는 공개키의 수
+WRITE_CHUNK = 1024
+
+
+def write_keys(path: str, points):
+    """
+    공개키를 33 bytes의 압축 형식으로 파일 끝에 추가
+    추가한 후에는 build_index()로 index를 다시 만들어야 함
+
+    Args:
+        path (str): 키 파일의 경로
+        points (Iterable[tuple]): 공개키 (affine) 목록
+
+    Returns:
+        int: 추가한 키의 수
+    """
+
+    count = 0
+
+    with open(path, 'ab') as f:
+        for point in points:
+            f.write(compress(point))
+            count += 1
+
+    return count
+
+
+def build_index(path: str):
+    """
+    키 파일의 모든 키에 대해 (hash160, 번호)를 hash160 순서로 정렬한 index 파일을 생성
+    키를 INDEX_RUN개씩 읽어 28 bytes 항목으로 정렬한 임시 파일을 만든 후 하나로 병합하므로,
+    키의 수와 관계 없이 메모리에는 INDEX_RUN개의 항목만 올라감
+
+    Args:
+        path (str): 키 파일의 경로
+
+    Returns:
+        int: index에 기록한 키의 수
+    """
+
+    runs = []
+    count = 0
+    # 다른 프로세스가 만들다 만 index를 읽지 않도록 임시 파일에 쓴 후 교체
+    # (같은 키 파일의 index를 동시에 만드는 프로세스끼리 임시 파일이 겹치지 않도록 PID를 붙임)
+    prefix = f'{path}{INDEX_SUFFIX}.{os.getpid()}'
+    tmp = f'{prefix}.tmp'
+
+    try:
+        with open(path, 'rb') as f:
+            while data := f.read(KEY_SIZE * INDEX_RUN):
+                entries = sorted(key_hash160(data[offset:offset + KEY_SIZE]) + (count + i).to_bytes(8, 'big')
+                                 for i, offset in enumerate(range(0, len(data), KEY_SIZE)))
+                count += len(entries)
+
+                runs.append(f'{prefix}.{len(runs)}.tmp')
+                with open(runs[-1], 'wb') as run:
+                    run.write(b''.join(entries))
+
+        with open(tmp, 'wb') as f, contextlib.ExitStack() as stack:
+            readers = [iter(functools.partial(stack.enter_context(open(run, 'rb')).read, INDEX_SIZE), b'')
+                       for run in runs]
+            f.writelines(heapq.merge(*readers))
+
+        os.replace(tmp, path + INDEX_SUFFIX)
+    finally:
+        for run in runs:
+            os.remove(run)
+
+        # 병합 중에 실패한 경우 남은 임시 index 파일을 삭제
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp)
+
+    return count
+
+
+def map_file(path: str):
+    """
+    파일을 읽기 전용으로 memory-map, 빈 파일은 mmap을 만들 수 없으므로 b''를 반환
+
+    Args:
+        path (str): 파일의 경로
+
+    Returns:
+        mmap.mmap: memory-map된 파일
+    """
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class KeyStore:
+    """
+    33 bytes 고정 길이의 압축 공개키 파일과 hash160 index를 memory-map하여 읽는 저장소
+    i번째 키는 파일의 i * 33 위치에 있으므로 바로 읽을 수 있고,
+    hash160으로 찾을 때는 정렬된 index에서 이진 탐색을 수행함 (O(log n))
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): 키 파일의 경로, index 파일은 path + '.idx'
+
+        Raises:
+            ValueError: 키 파일과 index의 크기가 맞지 않는 경우
+        """
+
+        self.path = path
+        self.keys = map_file(path)
+        self.index = map_file(path + INDEX_SUFFIX) if os.path.exists(path + INDEX_SUFFIX) else b''
+
+        if len(self.keys) % KEY_SIZE:
+            raise ValueError(f'키 파일의 크기가 {KEY_SIZE}의 배수가 아님')
+        if len(self.index) != len(self) * INDEX_SIZE:
+            raise ValueError('index가 키 파일과 맞지 않음, build_index()를 다시 실행해야 함')
+
+    def __len__(self):
+        return len(self.keys) // KEY_SIZE
+
+    def __getitem__(self, i: int):
+        """
+        i번째 압축 공개키
+
+        Args:
+            i (int): 키의 번호
+
+        Returns:
+            bytes: 압축 공개키 (33 bytes)
+        """
+
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+
+        i %= len(self)
+
+        return self.keys[i * KEY_SIZE:(i + 1) * KEY_SIZE]
+
+    def point(self, i: int):
+        """
+        i번째 공개키의 y 좌표를 복원하여 반환
+
+        Args:
+            i (int): 키의 번호
+
+        Returns:
+            tuple: 공개키 (affine)
+        """
+
+        return decompress(self[i])
+
+    def find(self, h: bytes):
+        """
+        hash160이 h인 키의 번호를 이진 탐색으로 찾음
+
+        Args:
+            h (bytes): 20 bytes의 hash160
+
+        Returns:
+            int: 키의 번호, 없으면 None
+        """
+
+        lo, hi = 0, len(self.index) // INDEX_SIZE
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = mid * INDEX_SIZE
+
+            if self.index[offset:offset + 20] < h:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        offset = lo * INDEX_SIZE
+
+        if self.index[offset:offset + 20] == h:
+            return int.from_bytes(self.index[offset + 20:offset + INDEX_SIZE], 'big')
+
+        return None
+
+    def __contains__(self, h: bytes):
+        return self.find(h) is not None
+
+    def close(self):
+        for m in (self.keys, self.index):
+            if isinstance(m, mmap.mmap):
+                m.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+if __name__ == '__main__':
+    path = input('키 파일의 경로? ')
+    count = int(input('생성할 키의 수? '))
+
+    # 1부터 count까지의 개인키에 대한 공개키를 WRITE_CHUNK개씩 계산하여 저장한 후 index를 생성한다.
+    write_keys(path, (point for start in range(1, count + 1, WRITE_CHUNK)
+                      for point in multiply_generator_many(list(range(start, min(start + WRITE_CHUNK, count + 1))))))
+    build_index(path)
+
+    with KeyStore(path) as store:
+        print(f'저장된 키의 수 = {len(store)}, 파일 크기 = {len(store) * KEY_SIZE} bytes')
+
+        # 마지막 키를 hash160으로 찾아 y 좌표를 복원한다.
+        key = store[-1]
+        i = store.find(key_hash160(key))
+        print(f'hash160 = {key_hash160(key).hex()}, 번호 = {i}')
+        print(f'공개키 = {store.point(i)}')
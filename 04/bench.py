@@ -0,0 +1,103 @@
+import time
+import random
+import hashlib
+import importlib
+import base58check
+from Crypto.Hash import RIPEMD160
+
+# 같은 디렉토리의 1.py (비트코인 주소 생성 예제)
+bitcoin = importlib.import_module('1')
+# 1.py가 sys.path에 추가한 저장소 최상위의 eccore 패키지
+from eccore import multiply_generator_many
+
+# 벤치마크에 사용할 공개키의 수와 반복 횟수
+COUNT = 2000
+REPEAT = 5
+
+
+def hex_addr(x: int, y: int):
+    """
+    비교를 위한 이전 방식의 주소 생성 (각 단계마다 16진수 문자열로 변환)
+    x의 앞자리가 0인 경우 잘못된 공개키가 만들어지므로 결과가 다를 수 있음
+
+    Args:
+        x (int): 공개키의 x 좌표
+        y (int): 공개키의 y 좌표
+
+    Returns:
+        hash, address: 공개키의 Hash 값과, 비트코인 주소를 반환
+    """
+
+    hash = f'{"03" if y % 2 else "02"}{format(x, "x")}'
+    hash = hashlib.sha256(bytes.fromhex(hash)).hexdigest()
+
+    r = RIPEMD160.new()
+    r.update(bytes.fromhex(hash))
+
+    hash = f'00{r.hexdigest()}'
+    chk = hash
+
+    for _ in range(2):
+        chk = hashlib.sha256(bytes.fromhex(chk)).hexdigest()
+
+    addr = f'{hash}{chk[:8]}'
+
+    return hash, base58check.b58encode(bytes.fromhex(addr)).decode()
+
+
+def bytes_addr(x: int, y: int):
+    """
+    bytes 방식의 주소 생성
+
+    Args:
+        x (int): 공개키의 x 좌표
+        y (int): 공개키의 y 좌표
+
+    Returns:
+        hash, address: 공개키의 Hash 값과, 비트코인 주소를 반환
+    """
+
+    return bitcoin.encode_addr(bitcoin.address_bytes(x, y))
+
+
+def measure(func, points: list):
+    """
+    REPEAT번 측정한 결과 중 가장 빠른 주소 하나당 실행 시간
+
+    Args:
+        func (Callable): 측정할 함수
+        points (list): 공개키 목록
+
+    Returns:
+        float: 주소 하나당 실행 시간 (마이크로초)
+    """
+
+    # warm-up
+    for x, y in points[:100]:
+        func(x, y)
+
+    best = float('inf')
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for x, y in points:
+            func(x, y)
+        best = min(best, time.perf_counter() - start)
+
+    return best / len(points) * 1e6
+
+
+if __name__ == '__main__':
+    # x 좌표의 앞자리가 0이 아닌 공개키만 사용 (이전 방식과 결과를 비교하기 위함)
+    points = [point for point in multiply_generator_many([random.getrandbits(256) for _ in range(COUNT)])
+              if point[0] >> 252]
+
+    assert all(hex_addr(x, y) == bytes_addr(x, y) for x, y in points)
+
+    before = measure(hex_addr, points)
+    after = measure(bytes_addr, points)
+    hash_only = measure(bitcoin.address_bytes, points)
+
+    print(f'16진수 문자열 방식 : {before:8.2f} us/address')
+    print(f'bytes 방식         : {after:8.2f} us/address ({before / after:.2f}x)')
+    print(f'bytes 방식 (Base58 제외): {hash_only:8.2f} us/address ({before / hash_only:.2f}x)')
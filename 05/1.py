@@ -1,16 +1,204 @@
 from bitmap import BitMap
+from itertools import islice
 import hashlib
+import math
+import mmap
+import os
+import struct
+
+# 설치되어 있으면 더 빠른 hash 함수를 사용
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import mmh3
+except ImportError:
+    mmh3 = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MASK64 = (1 << 64) - 1
+# add_many(), contains_many()에서 한 번에 처리하는 항목의 수
+BATCH_SIZE = 65536
+
+
+# 파일 형식: magic, version, k, m, n, hash 함수의 이름, 배치 방식 (64 bytes로 맞춘 후 비트 배열이 이어짐)
+# 배치 방식은 0: BloomFilter, 1: BlockedBloomFilter, 2: CountingBloomFilter (이전 파일은 0으로 채워져 있음)
+FILE_MAGIC = b'BLMF'
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct('<4sHHQQ16sB')
+FILE_HEADER_SIZE = 64
+# load()의 mode: 읽기 전용 (여러 프로세스가 공유), 읽기/쓰기 (파일에 반영), copy-on-write (파일에 반영하지 않음)
+MMAP_ACCESS = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+
+
+# 128비트 (16 bytes) digest, 앞 8 bytes와 뒤 8 bytes를 두 개의 64비트 hash (h1, h2)로 사용
+def digest_xxhash(data: bytes):
+    return xxhash.xxh3_128_digest(data)
+
+
+def digest_mmh3(data: bytes):
+    return mmh3.hash_bytes(data)
+
+
+def digest_blake2b(data: bytes):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def to_bytes(item):
+    # str은 UTF-8로 인코딩하고, bytes는 그대로 사용
+    # bytes(int)는 0으로 채운 bytes를 만들므로 그 외의 type은 받지 않음
+    if isinstance(item, str):
+        return item.encode()
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return bytes(item)
+
+    raise TypeError(f'str 또는 bytes가 아닌 항목: {type(item).__name__}')
+
+
+# 사용할 수 있는 double hashing용 hash 함수 ('sha256'은 항목마다 k번 SHA-256을 계산하는 기존 방식)
+HASHES = {'blake2b': digest_blake2b}
+
+if mmh3:
+    HASHES['mmh3'] = digest_mmh3
+if xxhash:
+    HASHES['xxhash'] = digest_xxhash
+
+# 가장 빠른 hash 함수 (xxhash > mmh3 > blake2b)
+FAST_HASH = 'xxhash' if xxhash else 'mmh3' if mmh3 else 'blake2b'
 
 
 class BloomFilter:
-    def __init__(self, m, k):
+    # 파일에 기록하는 배치 방식과 위치 하나가 차지하는 비트의 수
+    LAYOUT = 0
+    SLOT_BITS = 1
+
+    def __init__(self, m, k, hash='sha256'):
+        if hash == 'fast':
+            hash = FAST_HASH
+        if hash != 'sha256' and hash not in HASHES:
+            raise ValueError(f'사용할 수 없는 hash 함수: {hash}')
+
         self.m = m
         self.k = k
         self.n = 0
-        self.bf: BitMap = BitMap(m)
+        self.hash = hash
+        # BitMap(m)은 m / 8개의 정수로 된 list를 거쳐 배열을 만들므로, 0으로 채운 bytearray를 직접 할당
+        self.bf: BitMap = BitMap()
+        self.bf.bitmap = bytearray((m * self.SLOT_BITS + 7) // 8)
+        # load()로 읽은 경우 비트 배열이 있는 파일의 mmap
+        self.mm = None
+        # create()로 만든 경우 예상 항목의 수와 목표 오탐률
+        self.capacity = None
+        self.target_fpr = None
+
+    @classmethod
+    def create(cls, capacity, fpr, hash='fast'):
+        # capacity개의 항목을 추가했을 때 오탐률이 fpr이 되는 최적의 m과 k를 계산
+        # m = -n ln(p) / (ln 2)^2, k = (m / n) ln 2
+        if capacity <= 0 or not 0 < fpr < 1:
+            raise ValueError(f'잘못된 capacity 또는 fpr: {capacity}, {fpr}')
+
+        m = math.ceil(-capacity * math.log(fpr) / math.log(2) ** 2)
+        k = max(1, round(m / capacity * math.log(2)))
+
+        bf = cls(m, k, hash)
+        bf.capacity, bf.target_fpr = capacity, fpr
+
+        return bf
+
+    def count(self):
+        # 1인 비트의 수 (BitMap.count()보다 빠름)
+        return int.from_bytes(memoryview(self.bf.bitmap), 'little').bit_count()
+
+    def fill_ratio(self):
+        # 1인 비트의 비율
+        return self.count() / self.m
+
+    def estimated_fpr(self):
+        # 현재 상태에서의 오탐률 추정치: 임의의 k개 비트가 모두 1일 확률
+        return self.fill_ratio() ** self.k
+
+    def estimated_items(self):
+        # 1인 비트의 수로부터 추정한 서로 다른 항목의 수: -(m / k) ln(1 - X / m)
+        fill = self.fill_ratio()
+        return math.inf if fill >= 1 else -self.m / self.k * math.log(1 - fill)
+
+    def overfilled(self):
+        # create()로 만든 경우 예상 항목의 수 또는 목표 오탐률을 넘었는지에 대한 여부
+        if self.capacity is None:
+            return False
+
+        return self.n > self.capacity or self.estimated_fpr() > self.target_fpr
 
     def getPositions(self, item):
-        return [int(hashlib.sha256((item + str(i)).encode()).hexdigest(), 16) % self.m for i in range(1, self.k+1)]
+        data = to_bytes(item)
+
+        if self.hash == 'sha256':
+            return [int.from_bytes(hashlib.sha256(data + str(i).encode()).digest(), 'big') % self.m
+                    for i in range(1, self.k+1)]
+
+        # Kirsch–Mitzenmacher double hashing: 한 번의 digest로 g_i = h1 + i * h2 (mod m)
+        # NumPy의 uint64 연산과 같은 결과가 되도록 h1 + i * h2는 2^64로 나눈 나머지를 사용
+        digest = HASHES[self.hash](data)
+        h1, h2 = int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big')
+        return [((h1 + i * h2) & MASK64) % self.m for i in range(self.k)]
+
+    def getPositionsMany(self, items):
+        # 여러 항목의 위치를 (항목의 수, k) 크기의 NumPy 배열로 계산
+        if self.hash == 'sha256':
+            return np.array([self.getPositions(item) for item in items], dtype=np.uint64).reshape(-1, self.k)
+
+        digests = b''.join(map(HASHES[self.hash], map(to_bytes, items)))
+        h = np.frombuffer(digests, dtype='>u8').reshape(-1, 2).astype(np.uint64)
+        i = np.arange(self.k, dtype=np.uint64)
+
+        return (h[:, :1] + i * h[:, 1:]) % np.uint64(self.m)
+
+    def bits(self):
+        # BitMap의 내부 배열을 복사하지 않고 NumPy 배열로 사용 (pos번째 비트는 pos // 8 byte의 pos % 8 비트)
+        return np.frombuffer(self.bf.bitmap, dtype=np.uint8)
+
+    def batches(self, items):
+        items = iter(items)
+
+        while batch := list(islice(items, BATCH_SIZE)):
+            yield batch
+
+    def add_many(self, items):
+        # NumPy가 없으면 하나씩 추가
+        if np is None:
+            for item in items:
+                self.add(item)
+            return
+
+        bits = self.bits()
+
+        for batch in self.batches(items):
+            positions = self.getPositionsMany(batch).ravel()
+            masks = np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)
+            np.bitwise_or.at(bits, positions >> np.uint64(3), masks)
+            self.n += len(batch)
+
+    def contains_many(self, items):
+        # 각 항목의 포함 여부를 bool 배열로 반환 (NumPy가 없으면 list)
+        if np is None:
+            return [self.contains(item) for item in items]
+
+        bits = self.bits()
+        results = [np.zeros(0, dtype=bool)]
+
+        for batch in self.batches(items):
+            positions = self.getPositionsMany(batch)
+            found = bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8) & 1
+            results.append(found.all(axis=1))
+
+        return np.concatenate(results)
 
     def add(self, item):
         for p in self.getPositions(item):
@@ -26,11 +214,332 @@ class BloomFilter:
         return True
 
     def reset(self):
-        self.bf = BitMap(self.m)
+        # 파일에서 읽은 경우에도 같은 비트 배열을 사용하도록 제자리에서 0으로 채움
+        bits = memoryview(self.bf.bitmap)
+        bits[:] = bytes(len(bits))
         self.n = 0
 
+    def compatible(self, other):
+        # 같은 위치에 같은 항목이 기록되려면 배치 방식 (class), m, k, hash 함수가 모두 같아야 함
+        a = (type(self).__name__, self.LAYOUT, self.m, self.k, self.hash)
+        b = (type(other).__name__, getattr(other, 'LAYOUT', None), other.m, other.k, other.hash)
+
+        if a != b:
+            raise ValueError(f'호환되지 않는 Bloom filter: (class, layout, m, k, hash) = {a}, {b}')
+
+    def merge(self, other, op):
+        # op ('or', 'and') 연산으로 other의 비트 배열을 제자리에서 합침
+        if np is not None:
+            a = self.bits()
+            (np.bitwise_or if op == 'or' else np.bitwise_and)(a, other.bits(), out=a)
+            return
+
+        bits = memoryview(self.bf.bitmap)
+        a = int.from_bytes(bits, 'little')
+        b = int.from_bytes(memoryview(other.bf.bitmap), 'little')
+        bits[:] = (a | b if op == 'or' else a & b).to_bytes(len(bits), 'little')
+
+    def union(self, other):
+        # 두 filter 중 하나에라도 추가된 항목을 포함하도록 제자리에서 OR
+        # n은 두 filter의 항목 수의 합 (중복된 항목이 있으면 실제보다 큼)
+        self.compatible(other)
+        self.merge(other, 'or')
+        self.n += other.n
+        return self
+
+    def intersection(self, other):
+        # 두 filter 모두에 추가된 항목을 포함하도록 제자리에서 AND
+        # n은 두 filter의 항목 수 중 작은 값 (실제 공통 항목의 수의 상한)
+        self.compatible(other)
+        self.merge(other, 'and')
+        self.n = min(self.n, other.n)
+        return self
+
+    __ior__ = union
+    __iand__ = intersection
+
+    def header(self):
+        return FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, self.k, self.m, self.n, self.hash.encode(), self.LAYOUT)
+
+    def save(self, path):
+        # 다른 프로세스가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 후 교체
+        with open(path + '.tmp', 'wb') as f:
+            f.write(self.header().ljust(FILE_HEADER_SIZE, b'\0'))
+            f.write(memoryview(self.bf.bitmap))
+
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path, mode='r'):
+        # 파일을 mmap하여 비트 배열을 복사하지 않고 사용하므로 큰 filter도 바로 열 수 있음
+        with open(path, 'r+b' if mode == 'r+' else 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=MMAP_ACCESS[mode])
+
+        if len(mm) < FILE_HEADER_SIZE:
+            mm.close()
+            raise ValueError(f'Bloom filter 파일이 아님: {path}')
+
+        magic, version, k, m, n, hash, layout = FILE_HEADER.unpack_from(mm)
+
+        if magic != FILE_MAGIC or version != FILE_VERSION or layout != cls.LAYOUT or \
+                len(mm) != FILE_HEADER_SIZE + (m * cls.SLOT_BITS + 7) // 8:
+            mm.close()
+            raise ValueError(f'지원하지 않는 Bloom filter 파일: {path}')
+
+        bf = cls(0, k, hash.rstrip(b'\0').decode())
+        bf.m, bf.n, bf.mm = m, n, mm
+        bf.bf.bitmap = memoryview(mm)[FILE_HEADER_SIZE:]
+
+        return bf
+
+    def flush(self):
+        # 'r+' mode로 읽은 경우 변경된 n과 비트 배열을 파일에 기록
+        self.mm[:FILE_HEADER.size] = self.header()
+        self.mm.flush()
+
+    def close(self):
+        # bits()로 만든 배열이 남아 있으면 mmap을 닫을 수 없으므로, 실패하면 비트 배열을 되돌린 후 BufferError
+        if self.mm is not None:
+            self.bf.bitmap.release()
+
+            try:
+                self.mm.close()
+            except BufferError:
+                self.bf.bitmap = memoryview(self.mm)[FILE_HEADER_SIZE:]
+                raise
+
+            self.bf.bitmap = bytearray()
+            self.mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f'M = {self.m}, F = {self.k}, hash = {self.hash}\nBitMap = {self.bf}\n항목의 수 = {self.n}, 1인 비트수 = {self.count()}\n' \
+            f'채워진 비율 = {self.fill_ratio():.4f}, 추정 오탐률 = {self.estimated_fpr():.6f}'
+
+
+class BlockedBloomFilter(BloomFilter):
+    # 하나의 항목의 k개 비트를 모두 64 bytes (512비트, cache line 하나) block 안에 두는 Bloom filter
+    # 조회할 때 cache miss가 한 번만 발생하는 대신, 같은 m과 k에서 오탐률이 조금 높음
+    LAYOUT = 1
+    BLOCK_BITS = 512
+
+    def __init__(self, m, k, hash='fast'):
+        if hash == 'sha256':
+            raise ValueError('BlockedBloomFilter는 double hashing용 hash 함수가 필요함')
+
+        # m은 block 크기의 배수로 올림
+        super().__init__(-(-m // self.BLOCK_BITS) * self.BLOCK_BITS, k, hash)
+
+    def getPositions(self, item):
+        # h1으로 block을 고르고, h2를 32비트씩 나누어 block 안에서 double hashing (홀수 간격이므로 k <= 512개의 위치가 모두 다름)
+        digest = HASHES[self.hash](to_bytes(item))
+        h1, h2 = int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big')
+        base = h1 % (self.m // self.BLOCK_BITS) * self.BLOCK_BITS
+        a, b = h2 & 0xFFFFFFFF, h2 >> 32 | 1
+
+        return [base + (a + i * b) % self.BLOCK_BITS for i in range(self.k)]
+
+    def getPositionsMany(self, items):
+        digests = b''.join(map(HASHES[self.hash], map(to_bytes, items)))
+        h = np.frombuffer(digests, dtype='>u8').reshape(-1, 2).astype(np.uint64)
+        i = np.arange(self.k, dtype=np.uint64)
+        block = np.uint64(self.BLOCK_BITS)
+
+        base = h[:, :1] % np.uint64(self.m // self.BLOCK_BITS) * block
+        a, b = h[:, 1:] & np.uint64(0xFFFFFFFF), h[:, 1:] >> np.uint64(32) | np.uint64(1)
+
+        return base + (a + i * b) % block
+
+
+class CountingBloomFilter(BloomFilter):
+    # 위치마다 4비트 counter를 두어 remove()를 지원하는 Bloom filter
+    # counter i는 i // 2번째 byte의 하위 (i가 짝수) 또는 상위 (i가 홀수) 4비트이며, 15가 되면 더 이상 변하지 않음
+    LAYOUT = 2
+    SLOT_BITS = 4
+
+    def __init__(self, m, k, hash='fast'):
+        super().__init__(m, k, hash)
+
+    def get(self, i):
+        return self.bf.bitmap[i >> 1] >> (i & 1) * 4 & 15
+
+    def put(self, i, value):
+        shift = (i & 1) * 4
+        self.bf.bitmap[i >> 1] = self.bf.bitmap[i >> 1] & ~(15 << shift) | value << shift
+
+    def add(self, item):
+        for p in self.getPositions(item):
+            self.put(p, min(self.get(p) + 1, 15))
+
+        self.n += 1
+
+    def contains(self, item):
+        return all(self.get(p) for p in self.getPositions(item))
+
+    def remove(self, item):
+        # 추가되지 않은 항목을 제거하면 다른 항목의 counter가 줄어들므로 KeyError
+        positions = self.getPositions(item)
+
+        if not all(self.get(p) for p in positions):
+            raise KeyError(item)
+
+        for p in positions:
+            value = self.get(p)
+
+            # 15인 counter는 실제 값을 알 수 없으므로 줄이지 않음
+            if value < 15:
+                self.put(p, value - 1)
+
+        self.n -= 1
+
+    def update(self, positions, delta):
+        # 짝수 위치와 홀수 위치를 나누어 처리하여 같은 byte에 동시에 쓰지 않도록 함
+        data = self.bits()
+        positions, counts = np.unique(positions.ravel(), return_counts=True)
+
+        for odd in (0, 1):
+            select = positions & np.uint64(1) == odd
+            index = positions[select] >> np.uint64(1)
+            shift = np.uint8(odd * 4)
+            value = (data[index] >> shift & 15).astype(np.int64)
+            value = np.where(value == 15, 15, np.clip(value + delta * counts[select], 0, 15)).astype(np.uint8)
+            data[index] = data[index] & ~np.uint8(15 << shift) | value << shift
+
+    def add_many(self, items):
+        if np is None:
+            for item in items:
+                self.add(item)
+            return
+
+        for batch in self.batches(items):
+            self.update(self.getPositionsMany(batch), 1)
+            self.n += len(batch)
+
+    def contains_many(self, items):
+        if np is None:
+            return [self.contains(item) for item in items]
+
+        data = self.bits()
+        results = [np.zeros(0, dtype=bool)]
+
+        for batch in self.batches(items):
+            positions = self.getPositionsMany(batch)
+            shift = ((positions & np.uint64(1)) << np.uint64(2)).astype(np.uint8)
+            results.append((data[positions >> np.uint64(1)] >> shift & 15 > 0).all(axis=1))
+
+        return np.concatenate(results)
+
+    def nibbles(self, data, shift):
+        # 짝수 (shift = 0) 또는 홀수 (shift = 4) 위치의 counter 배열
+        return data >> np.uint8(shift) & np.uint8(15)
+
+    def count(self):
+        # 0이 아닌 counter의 수
+        if np is None:
+            return sum(1 for i in range(self.m) if self.get(i))
+
+        data = self.bits()
+        return int(np.count_nonzero(self.nibbles(data, 0)) + np.count_nonzero(self.nibbles(data, 4)))
+
+    def merge(self, other, op):
+        # 합집합은 counter의 합 (최대 15), 교집합은 counter의 최솟값
+        if np is None:
+            for i in range(self.m):
+                a, b = self.get(i), other.get(i)
+                self.put(i, min(a + b, 15) if op == 'or' else min(a, b))
+            return
+
+        data, other = self.bits(), other.bits()
+        merged = []
+
+        for shift in (0, 4):
+            a, b = self.nibbles(data, shift), self.nibbles(other, shift)
+            merged.append(np.minimum(a + b, 15) if op == 'or' else np.minimum(a, b))
+
+        data[:] = merged[0] | merged[1] << np.uint8(4)
+
+    def __repr__(self):
+        counters = ''.join(format(self.get(i), 'x') for i in range(self.m - 1, -1, -1))
+        return f'M = {self.m}, F = {self.k}, hash = {self.hash}\nCounter = {counters}\n' \
+            f'항목의 수 = {self.n}, 0이 아닌 counter의 수 = {self.count()}\n' \
+            f'채워진 비율 = {self.fill_ratio():.4f}, 추정 오탐률 = {self.estimated_fpr():.6f}'
+
+
+class ScalableBloomFilter:
+    # 항목이 늘어나면 더 큰 sub-filter를 추가하는 Bloom filter (Almeida et al., Scalable Bloom Filters)
+    # i번째 sub-filter는 capacity * growth^i개의 항목을 오탐률 fpr * (1 - ratio) * ratio^i로 보관하므로
+    # 전체 오탐률은 fpr 이하로 유지됨
+    def __init__(self, capacity, fpr, growth=2, ratio=0.9, hash='fast'):
+        self.capacity = capacity
+        self.fpr = fpr
+        self.growth = growth
+        self.ratio = ratio
+        self.hash = hash
+        self.filters = []
+        self.grow()
+
+    def grow(self):
+        i = len(self.filters)
+        self.filters.append(BloomFilter.create(self.capacity * self.growth ** i,
+                                               self.fpr * (1 - self.ratio) * self.ratio ** i, self.hash))
+
+    @property
+    def n(self):
+        return sum(bf.n for bf in self.filters)
+
+    @property
+    def m(self):
+        return sum(bf.m for bf in self.filters)
+
+    def add(self, item):
+        if self.filters[-1].n >= self.filters[-1].capacity:
+            self.grow()
+
+        self.filters[-1].add(item)
+
+    def contains(self, item):
+        return any(bf.contains(item) for bf in self.filters)
+
+    def add_many(self, items):
+        items = iter(items)
+
+        # 마지막 sub-filter의 남은 공간만큼씩 나누어 추가
+        while True:
+            last = self.filters[-1]
+
+            if last.n >= last.capacity:
+                self.grow()
+                continue
+
+            batch = list(islice(items, last.capacity - last.n))
+
+            if not batch:
+                return
+
+            last.add_many(batch)
+
+    def contains_many(self, items):
+        items = list(items)
+        results = self.filters[0].contains_many(items)
+
+        for bf in self.filters[1:]:
+            results = [a or b for a, b in zip(results, bf.contains_many(items))] if np is None \
+                else results | bf.contains_many(items)
+
+        return results
+
+    def estimated_fpr(self):
+        # 하나의 sub-filter에서라도 오탐이 발생할 확률
+        return 1 - math.prod(1 - bf.estimated_fpr() for bf in self.filters)
+
     def __repr__(self):
-        return f'M = {self.m}, F = {self.k}\nBitMap = {self.bf}\n항목의 수 = {self.n}, 1인 비트수 = {self.bf.count()}'
+        return f'sub-filter의 수 = {len(self.filters)}, M = {self.m}, 항목의 수 = {self.n}\n' \
+            f'목표 오탐률 = {self.fpr}, 추정 오탐률 = {self.estimated_fpr():.6f}'
 
 
 if __name__ == '__main__':
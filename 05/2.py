@@ -1,42 +1,340 @@
+import os
+import sys
 import time
 import struct
+import asyncio
 import hashlib
+import inspect
+import datetime
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# nonce, ext_nonce는 4 bytes little-endian
+UINT32 = struct.Struct('<I')
+NONCE_LIMIT = 2**32
+# 80 bytes block header: version, 이전 block의 hash, merkle root, time, bits, nonce (hash는 내부 byte 순서)
+HEADER = struct.Struct('<I32s32sIII')
+# header를 검증할 때 한 번에 읽는 header의 수
+VALIDATE_CHUNK = 8192
+# worker가 검사한 hash의 수를 보고하고 중단 신호를 확인하는 주기 (nonce의 수)
+REPORT_INTERVAL = 2**16
+
+# worker 프로세스에서 공유하는 중단 신호와 계산한 hash의 수
+_stop = None
+_counter = None
+
+
+def target_from_compact(bits):
+    # compact 형식의 정수 bits (예: 0x1d00ffff)를 256비트 target으로 변환
+    return (bits & 0xFFFFFF) << 8 * ((bits >> 24) - 3)
+
+
+def target_from_bits(bits):
+    # compact 형식의 bits (예: '1f0fffff')를 256비트 target으로 변환
+    return target_from_compact(int(bits, 16))
+
+
+def target_bytes(target):
+    # hash 결과와 bytes 그대로 비교할 수 있도록 32 bytes big-endian으로 변환 (2^256 이상이면 모든 hash가 통과)
+    return min(target, 2**256 - 1).to_bytes(32, byteorder='big')
+
+
+def mine(prefix, target, start=0, end=NONCE_LIMIT):
+    # prefix 뒤에 nonce를 붙인 값의 double SHA-256이 target 이하가 되는 nonce를 [start, end)에서 탐색
+    # prefix의 SHA-256 상태(midstate)를 한 번만 계산하고 nonce마다 복사하여 4 bytes만 추가로 hash
+    midstate = hashlib.sha256(prefix)
+    buf = bytearray(4)
+    sha256 = hashlib.sha256
+
+    for nonce in range(start, end):
+        UINT32.pack_into(buf, 0, nonce)
+        h = midstate.copy()
+        h.update(buf)
+        result = sha256(h.digest()).digest()
+
+        # 길이가 같은 big-endian bytes는 사전순 비교가 정수 비교와 같음
+        if result <= target:
+            return nonce, result
+
+    return None, None
 
 
 def pow(msg, bits):
-    bits = bytes.fromhex(bits)
-    target = int.from_bytes(bits[1:], byteorder='big') << 8 * (bits[0] - 3)
+    target = target_from_bits(bits)
+    goal = target_bytes(target)
+    data = msg.encode('utf-8')
 
-    nonce = 0
-    ext_nonce = int(time.time())
+    ext_nonce = first = int(time.time())
 
     print(f"Target: 0x{format(target, 'x').zfill(64)}")
 
     start = time.time()
     while True:
-        data = msg.encode('utf-8') + struct.pack('<I',
-                                                 ext_nonce) + struct.pack('<I', nonce)
-        result = hashlib.sha256(hashlib.sha256(
-            data).digest()).digest()
+        nonce, result = mine(data + UINT32.pack(ext_nonce % NONCE_LIMIT), goal)
 
-        if int.from_bytes(result, byteorder='big') <= target:
+        if nonce is not None:
             break
 
-        nonce += 1
-
-        if nonce >= 2**32:
-            ext_nonce += 1
-            nonce = 0
+        # nonce를 모두 사용하면 ext_nonce를 증가시킴
+        ext_nonce += 1
 
     end = time.time()
+    hashes = (ext_nonce - first) * NONCE_LIMIT + nonce + 1
 
-    print(f'메시지: {msg}, Extra nonce: {ext_nonce}, nonce: {nonce}')
-    print(f'실행 시간: {end - start}초')
+    print(f'메시지: {msg}, Extra nonce: {ext_nonce % NONCE_LIMIT}, nonce: {nonce}')
+    print(f'실행 시간: {end - start}초, {hashes} 번의 hash, {hashes / (end - start) if end > start else 0:.0f} H/s')
     print(f'Hash result: 0x{result.hex()}')
 
 
+def expected_hashes(target):
+    # hash가 target 이하가 될 때까지 필요한 평균 시도 횟수
+    return 2**256 / (min(target, 2**256 - 1) + 1)
+
+
+def mine_until(data, goal, ext_nonce, cancel, deadline, stats):
+    # mine()을 REPORT_INTERVAL개의 nonce씩 반복하며 stats['hashes']에 계산한 hash의 수를 누적
+    # 그 사이에 cancel이 설정되거나 deadline (time.time() 기준)이 지나면 None을 반환
+    while True:
+        prefix = data + UINT32.pack(ext_nonce % NONCE_LIMIT)
+
+        for start in range(0, NONCE_LIMIT, REPORT_INTERVAL):
+            nonce, result = mine(prefix, goal, start, start + REPORT_INTERVAL)
+
+            if nonce is not None:
+                stats['hashes'] += nonce - start + 1
+                return ext_nonce % NONCE_LIMIT, nonce, result
+
+            stats['hashes'] += REPORT_INTERVAL
+
+            if cancel.is_set() or (deadline is not None and time.time() >= deadline):
+                return None
+
+        ext_nonce += 1
+
+
+async def pow_async(msg, bits, cancel=None, deadline=None, progress=None, interval=1.0, executor=None):
+    # event loop를 막지 않도록 hash loop를 executor (기본값은 event loop의 thread pool)에서 실행
+    # cancel (threading.Event)이 설정되면 CancelledError, deadline (time.time() 기준)이 지나면 TimeoutError
+    # progress는 interval초마다 {'hashes', 'rate', 'eta', 'elapsed'}를 인자로 호출 (coroutine 함수도 가능)
+    # 반환 값: (ext_nonce, nonce, hash, 계산한 hash의 수, 초당 hash의 수)
+    # executor는 ThreadPoolExecutor만 가능 (cancel과 stats를 worker와 공유해야 하므로 다른 프로세스로 보낼 수 없음)
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise TypeError(f'pow_async()의 executor는 ThreadPoolExecutor여야 함: {type(executor).__name__}')
+
+    loop = asyncio.get_running_loop()
+    cancel = cancel or threading.Event()
+    target = target_from_bits(bits)
+    expected = expected_hashes(target)
+    # worker thread는 hashes만 증가시키고, 나머지 계산은 event loop에서 수행
+    stats = {'hashes': 0}
+
+    start = time.time()
+    future = loop.run_in_executor(executor, mine_until, msg.encode('utf-8'), target_bytes(target),
+                                  int(time.time()), cancel, deadline, stats)
+
+    try:
+        while not future.done():
+            await asyncio.wait({future}, timeout=interval)
+
+            if progress is not None and not future.done():
+                elapsed = time.time() - start
+                rate = stats['hashes'] / elapsed if elapsed else 0
+                report = {
+                    'hashes': stats['hashes'],
+                    'rate': rate,
+                    # 남은 hash의 기댓값은 지금까지 계산한 수와 관계 없이 expected
+                    'eta': expected / rate if rate else float('inf'),
+                    'elapsed': elapsed,
+                }
+
+                if inspect.isawaitable(result := progress(report)):
+                    await result
+    finally:
+        # 호출한 task가 취소되거나 progress에서 예외가 발생하는 등 결과를 기다리지 않고 나가면 executor의 hash loop도 중단
+        if not future.done():
+            cancel.set()
+
+    found = future.result()
+    elapsed = time.time() - start
+
+    if found is None:
+        if cancel.is_set():
+            raise asyncio.CancelledError()
+        raise TimeoutError(f'deadline까지 찾지 못함 ({stats["hashes"]} 번의 hash)')
+
+    return found + (stats['hashes'], stats['hashes'] / elapsed if elapsed else 0)
+
+
+def pack_header(version, prev_hash, merkle_root, timestamp, bits, nonce=0):
+    return HEADER.pack(version, prev_hash, merkle_root, timestamp, bits, nonce)
+
+
+def block_hash(header):
+    # block의 hash (내부 byte 순서, 출력할 때는 뒤집어서 16진수로 표시)
+    return hashlib.sha256(hashlib.sha256(header).digest()).digest()
+
+
+def mine_header(header, goal, start=0, end=NONCE_LIMIT):
+    # header의 앞 76 bytes의 midstate를 재사용하여 nonce를 [start, end)에서 탐색
+    # block hash는 little-endian 정수이므로 뒤집어서 target과 비교하며, 대부분은 최상위 byte만으로 걸러짐
+    midstate = hashlib.sha256(header[:76])
+    buf = bytearray(4)
+    sha256 = hashlib.sha256
+    top = goal[0]
+
+    for nonce in range(start, end):
+        UINT32.pack_into(buf, 0, nonce)
+        h = midstate.copy()
+        h.update(buf)
+        result = sha256(h.digest()).digest()
+
+        if result[31] <= top and result[::-1] <= goal:
+            return nonce, result
+
+    return None, None
+
+
+def mine_block(version, prev_hash, merkle_root, timestamp, bits):
+    # nonce를 모두 사용하면 timestamp를 1초 증가시켜 다시 탐색, 찾은 80 bytes header를 반환
+    goal = target_bytes(target_from_compact(bits))
+
+    while True:
+        header = pack_header(version, prev_hash, merkle_root, timestamp, bits)
+        nonce, _ = mine_header(header, goal)
+
+        if nonce is not None:
+            return pack_header(version, prev_hash, merkle_root, timestamp, bits, nonce)
+
+        timestamp += 1
+
+
+def validate_headers(path, prev_hash=bytes(32)):
+    # 80 bytes header가 이어진 파일을 VALIDATE_CHUNK개씩 읽어 PoW와 이전 block hash의 연결을 검증
+    # 하나의 buffer를 재사용하고 memoryview로 잘라서 사용하므로 header마다 buffer를 만들지 않음
+    # 반환 값: 검증한 header의 수와 마지막 block의 hash, 잘못된 header가 있으면 ValueError
+    buf = bytearray(HEADER.size * VALIDATE_CHUNK)
+    view = memoryview(buf)
+    sha256 = hashlib.sha256
+    goals = {}
+    count = 0
+
+    with open(path, 'rb', buffering=0) as f:
+        while size := f.readinto(buf):
+            # 마지막 chunk가 덜 읽힌 경우 나머지를 채움
+            while size % HEADER.size and (more := f.readinto(view[size:])):
+                size += more
+
+            if size % HEADER.size:
+                raise ValueError(f'{count + size // HEADER.size}번째 header가 {HEADER.size} bytes보다 짧음')
+
+            for offset in range(0, size, HEADER.size):
+                header = view[offset:offset + HEADER.size]
+
+                if header[4:36] != prev_hash:
+                    raise ValueError(f'{count}번째 header의 이전 block hash가 일치하지 않음')
+
+                bits, = UINT32.unpack_from(buf, offset + 72)
+                goal = goals.get(bits) or goals.setdefault(bits, target_bytes(target_from_compact(bits)))
+                prev_hash = sha256(sha256(header).digest()).digest()
+
+                if prev_hash[::-1] > goal:
+                    raise ValueError(f'{count}번째 header의 hash가 target보다 큼')
+
+                count += 1
+
+    return count, prev_hash
+
+
+def init_worker(stop, counter):
+    global _stop, _counter
+    _stop, _counter = stop, counter
+
+
+def mine_partition(data, goal, ext_nonce, step):
+    # ext_nonce, ext_nonce + step, ext_nonce + 2 * step, ...의 nonce 공간을 차례로 탐색
+    # REPORT_INTERVAL개의 nonce마다 hash의 수를 보고하고, 다른 worker가 찾았으면 중단
+    while not _stop.is_set():
+        prefix = data + UINT32.pack(ext_nonce % NONCE_LIMIT)
+
+        for start in range(0, NONCE_LIMIT, REPORT_INTERVAL):
+            nonce, result = mine(prefix, goal, start, start + REPORT_INTERVAL)
+
+            with _counter.get_lock():
+                _counter.value += (nonce - start + 1) if nonce is not None else REPORT_INTERVAL
+
+            if nonce is not None:
+                _stop.set()
+                return ext_nonce % NONCE_LIMIT, nonce, result
+
+            if _stop.is_set():
+                return None
+
+        ext_nonce += step
+
+    return None
+
+
+def pow_parallel(msg, bits, workers=None, interval=1.0):
+    # ext_nonce를 workers개의 partition으로 나누어 여러 프로세스에서 탐색
+    # 하나의 worker가 찾으면 나머지 worker도 REPORT_INTERVAL 이내에 중단
+    # 반환 값: (ext_nonce, nonce, hash, 계산한 hash의 수, 초당 hash의 수)
+    workers = workers or os.cpu_count() or 1
+    target = target_from_bits(bits)
+    goal = target_bytes(target)
+    data = msg.encode('utf-8')
+
+    stop = multiprocessing.Event()
+    counter = multiprocessing.Value('Q', 0)
+    expected = expected_hashes(target)
+    base = int(time.time())
+
+    start = time.time()
+    found = None
+
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(stop, counter)) as executor:
+        futures = [executor.submit(mine_partition, data, goal, base + i, workers) for i in range(workers)]
+
+        # worker에서 예외가 발생하거나 Ctrl-C로 중단되어도 worker가 끝나야 executor를 닫을 수 있음
+        try:
+            while found is None:
+                done, _ = wait(futures, timeout=interval, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    found = found or future.result()
+
+                elapsed = time.time() - start
+                rate = counter.value / elapsed if elapsed else 0
+                # nonce마다 독립적인 시도이므로 남은 hash의 기댓값은 지금까지 계산한 수와 관계 없이 expected
+                eta = expected / rate if rate else 0
+                print(f'\r{counter.value} hashes, {rate:.0f} H/s, '
+                      f'예상 남은 시간 {datetime.timedelta(seconds=int(eta))}', end='', flush=True)
+        finally:
+            stop.set()
+
+    print()
+
+    elapsed = time.time() - start
+
+    return found + (counter.value, counter.value / elapsed if elapsed else 0)
+
+
 if __name__ == '__main__':
+    # header 파일을 인자로 주면 header chain을 검증한다.
+    if len(sys.argv) > 1:
+        start = time.time()
+        count, last = validate_headers(sys.argv[1])
+        elapsed = time.time() - start
+        print(f'{count}개의 header 검증 완료, 마지막 block: {last[::-1].hex()}')
+        print(f'실행 시간: {elapsed}초, {count / elapsed if elapsed else 0:.0f} headers/s')
+        sys.exit()
+
     msg = input('메시지의 내용? ')
     bits = input('Target bits? ')
 
-    pow(msg, bits)
+    # 모든 CPU를 사용하여 탐색한다.
+    ext_nonce, nonce, result, hashes, rate = pow_parallel(msg, bits)
+
+    print(f'메시지: {msg}, Extra nonce: {ext_nonce}, nonce: {nonce}')
+    print(f'총 {hashes} 번의 hash, {rate:.0f} H/s')
+    print(f'Hash result: 0x{result.hex()}')
@@ -0,0 +1,57 @@
+import time
+import importlib
+
+# 같은 디렉토리의 1.py (Bloom filter 예제)
+bloom = importlib.import_module('1')
+
+# 비교할 filter의 크기 (비트 또는 counter의 수)
+SIZES = [10 ** 6, 10 ** 7, 10 ** 8]
+# 위치의 수, 비트 수 대비 추가할 항목의 비율
+K = 7
+LOAD = 1 / 16
+# 조회할 항목의 수 (contains_many, contains)
+QUERIES = 200_000
+LOOP_QUERIES = 20_000
+
+VARIANTS = [
+    ('BloomFilter', lambda m: bloom.BloomFilter(m, K, hash='fast')),
+    ('BlockedBloomFilter', lambda m: bloom.BlockedBloomFilter(m, K)),
+    ('CountingBloomFilter', lambda m: bloom.CountingBloomFilter(m, K)),
+]
+
+
+def rate(func, count: int):
+    """
+    func를 실행하여 초당 처리한 항목의 수를 계산
+
+    Args:
+        func (Callable): 측정할 함수
+        count (int): func가 처리하는 항목의 수
+
+    Returns:
+        float: 초당 처리한 항목의 수
+    """
+
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    print(f'{"bits":>11} {"filter":<20} {"contains_many":>14} {"contains":>10} {"FPR":>8}')
+
+    for m in SIZES:
+        items = [f'item {i}' for i in range(int(m * LOAD))]
+        # 절반은 추가한 항목, 절반은 추가하지 않은 항목을 조회
+        queries = items[:QUERIES // 2] + [f'other {i}' for i in range(QUERIES // 2)]
+
+        for name, make in VARIANTS:
+            bf = make(m)
+            bf.add_many(items)
+
+            many = rate(lambda: bf.contains_many(queries), len(queries))
+            loop = rate(lambda: [bf.contains(item) for item in queries[:LOOP_QUERIES]], LOOP_QUERIES)
+            fpr = bf.contains_many(queries[QUERIES // 2:]).mean()
+
+            print(f'{m:>11} {name:<20} {many:>12.0f}/s {loop:>8.0f}/s {fpr:>8.5f}', flush=True)
+            del bf
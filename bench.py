@@ -0,0 +1,404 @@
+import os
+import sys
+import io
+import json
+import time
+import timeit
+import random
+import argparse
+import platform
+import statistics
+import importlib
+import importlib.util
+
+# 저장소의 최상위 디렉토리
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 하나의 측정 구간이 최소한 이 시간(초) 이상 걸리도록 반복 횟수를 정함
+MIN_TIME = 0.05
+# 측정 구간의 수
+REPEAT = 5
+# 비교 모드에서 회귀로 판단하는 기준 (중앙값이 10% 이상 느려진 경우)
+THRESHOLD = 0.10
+# pow 벤치마크에서 한 번에 검사하는 nonce의 수
+POW_NONCES = 2 ** 16
+
+
+def load(path: str, name: str):
+    """
+    숫자로 시작하는 디렉토리의 예제 파일은 import할 수 없으므로 경로를 통해 module로 읽음
+
+    Args:
+        path (str): 저장소 기준의 파일 경로 (예: '03/1.py')
+        name (str): module 이름
+
+    Returns:
+        module: 읽은 module
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return module
+
+
+def load_eccore():
+    """
+    저장소의 최상위 디렉토리에 있는 eccore 패키지를 읽음
+
+    Returns:
+        module: eccore
+    """
+
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    return importlib.import_module('eccore')
+
+
+# 각 벤치마크는 입력 크기를 받아 측정할 함수(인자 없음)를 반환함
+def bench_double_and_add(bits: int):
+    m = load('02/2.py', 'ex02_2')
+    k = random.getrandbits(bits) | 1 << (bits - 1)
+    return lambda: m.double_and_add(k, m.G)
+
+
+def bench_multiply(bits: int):
+    m = load_eccore()
+    k = random.getrandbits(bits) | 1 << (bits - 1)
+    return lambda: m.multiply(k, m.G)
+
+
+def bench_multiply_generator(bits: int):
+    m = load_eccore()
+    k = random.getrandbits(bits) | 1 << (bits - 1)
+    return lambda: m.multiply_generator(k)
+
+
+def bench_sign(size: int):
+    m = load('03/1.py', 'ex03_1')
+    d = m.ec.generate_private_key()
+    M = 'a' * size
+    return lambda: m.sign(M, d)
+
+
+def bench_verify(size: int):
+    m = load('03/1.py', 'ex03_1')
+    d = m.ec.generate_private_key()
+    e2 = m.ec.generate_public_key(d)
+    M = 'a' * size
+    S1, S2 = m.sign(M, d)
+    return lambda: m.verify_fast(M, S1, S2, e2)
+
+
+def bench_verify_batch(size: int):
+    m = load('03/1.py', 'ex03_1')
+    d = m.ec.generate_private_key()
+    e2 = m.ec.generate_public_key(d)
+    items = [(str(i), *m.sign(str(i), d), e2) for i in range(size)]
+    return lambda: m.verify_batch(items, workers=1)
+
+
+def bench_generate_addr(size: int):
+    m = load('04/1.py', 'ex04_1')
+    keys = [random.getrandbits(256) for _ in range(size)]
+    return lambda: [m.generate_addr(k) for k in keys]
+
+
+def bench_generate_addrs(size: int):
+    m = load('04/1.py', 'ex04_1')
+    keys = [random.getrandbits(256) for _ in range(size)]
+    return lambda: list(m.generate_addrs(keys))
+
+
+def bench_bloom_add(k: int):
+    m = load('05/1.py', 'ex05_1')
+    bf = m.BloomFilter(1_000_000, k)
+    items = [str(i) for i in range(100)]
+    return lambda: [bf.add(item) for item in items]
+
+
+def bench_bloom_contains(k: int):
+    m = load('05/1.py', 'ex05_1')
+    bf = m.BloomFilter(1_000_000, k)
+    items = [str(i) for i in range(100)]
+    for item in items[::2]:
+        bf.add(item)
+    return lambda: [bf.contains(item) for item in items]
+
+
+def bench_bloom_contains_fast(k: int):
+    m = load('05/1.py', 'ex05_1')
+    bf = m.BloomFilter(1_000_000, k, hash='fast')
+    items = [str(i) for i in range(100)]
+    for item in items[::2]:
+        bf.add(item)
+    return lambda: [bf.contains(item) for item in items]
+
+
+def bench_bloom_add_many(size: int):
+    m = load('05/1.py', 'ex05_1')
+    bf = m.BloomFilter(100_000_000, 7, hash='fast')
+    items = [str(i) for i in range(size)]
+    return lambda: bf.add_many(items)
+
+
+def bench_bloom_contains_many(size: int):
+    m = load('05/1.py', 'ex05_1')
+    bf = m.BloomFilter(100_000_000, 7, hash='fast')
+    items = [str(i) for i in range(size)]
+    bf.add_many(items[::2])
+    return lambda: bf.contains_many(items)
+
+
+def bench_pow(size: int):
+    m = load('05/2.py', 'ex05_2')
+    prefix = random.randbytes(size)
+
+    # 해답을 찾는 시간은 편차가 크므로, 해답이 없는 target (0)으로 고정된 수의 nonce를 모두 검사하는 시간을 측정
+    return lambda: m.mine(prefix, bytes(32), 0, POW_NONCES)
+
+
+def bench_convert_rsa(size: int):
+    m = load('02/1.py', 'ex02_1')
+    cwd = os.getcwd()
+
+    # read_keys()는 현재 디렉토리의 key 파일을 읽음
+    try:
+        os.chdir(os.path.join(ROOT, '02'))
+        public_key, private_key = m.read_keys()
+    finally:
+        os.chdir(cwd)
+
+    text = 'a' * size
+    return lambda: m.convert_rsa(m.convert_rsa(text, public_key), private_key, False)
+
+
+def bench_read_keys(source: str):
+    m = load('02/1.py', 'ex02_1')
+    path = os.path.join(ROOT, '02')
+
+    if source == 'parse':
+        # 매번 PEM 파일을 읽어 key 객체로 변환하는 경우
+        def run():
+            with open(os.path.join(path, 'public_key.pem'), 'rb') as f:
+                m.load_public_key(f.read())
+            with open(os.path.join(path, 'private_key.pem'), 'rb') as f:
+                m.load_private_key(f.read())
+
+        return run
+
+    def run():
+        cwd = os.getcwd()
+
+        try:
+            os.chdir(path)
+            m.read_keys()
+        finally:
+            os.chdir(cwd)
+
+    return run
+
+
+def bench_convert_aes(size: int):
+    m = load('02/1.py', 'ex02_1')
+    key = m.Fernet.generate_key()
+    text = 'a' * size
+    return lambda: m.convert_aes(m.convert_aes(text, key), key, False)
+
+
+def bench_stream(size: int):
+    m = load('02/1.py', 'ex02_1')
+    cwd = os.getcwd()
+
+    try:
+        os.chdir(os.path.join(ROOT, '02'))
+        public_key, private_key = m.read_keys()
+    finally:
+        os.chdir(cwd)
+
+    data = random.randbytes(size)
+
+    def run():
+        encrypted = io.BytesIO()
+        m.encrypt_stream(io.BytesIO(data), encrypted, public_key)
+        encrypted.seek(0)
+        m.decrypt_stream(encrypted, io.BytesIO(), private_key)
+
+    return run
+
+
+# (이름, 벤치마크 함수, 입력 크기 목록)
+BENCHMARKS = [
+    ('ec.double_and_add', bench_double_and_add, [64, 128, 256]),
+    ('eccore.multiply', bench_multiply, [256]),
+    ('eccore.multiply_generator', bench_multiply_generator, [256]),
+    ('ecdsa.sign', bench_sign, [32, 4096, 65536]),
+    ('ecdsa.verify_fast', bench_verify, [32, 4096, 65536]),
+    ('ecdsa.verify_batch', bench_verify_batch, [16, 128]),
+    ('bitcoin.generate_addr', bench_generate_addr, [1, 64]),
+    ('bitcoin.generate_addrs', bench_generate_addrs, [1, 64, 1024]),
+    ('bloom.add x100', bench_bloom_add, [3, 7, 15]),
+    ('bloom.contains x100', bench_bloom_contains, [3, 7, 15]),
+    ('bloom.contains_fast x100', bench_bloom_contains_fast, [3, 7, 15]),
+    ('bloom.add_many', bench_bloom_add_many, [1000, 100000]),
+    ('bloom.contains_many', bench_bloom_contains_many, [1000, 100000]),
+    ('pow.mine x65536', bench_pow, [80, 1000]),
+    ('hybrid.convert_rsa', bench_convert_rsa, [16, 128, 190]),
+    ('hybrid.read_keys', bench_read_keys, ['parse', 'read_keys']),
+    ('hybrid.convert_aes', bench_convert_aes, [16, 65536, 1048576]),
+    ('hybrid.stream', bench_stream, [16, 65536, 1048576]),
+]
+
+
+def measure(func, repeat: int = REPEAT):
+    """
+    warm-up 후 repeat번 측정한 한 번 호출당 실행 시간의 통계를 계산
+
+    Args:
+        func (Callable): 측정할 함수
+        repeat (int, optional): 측정 구간의 수
+
+    Returns:
+        dict: 한 번 호출당 실행 시간(초)의 min, median, mean, stdev와 반복 횟수
+    """
+
+    timer = timeit.Timer(func)
+
+    # warm-up을 겸하여 한 구간이 MIN_TIME 이상 걸리는 반복 횟수를 찾음
+    number = 1
+    while timer.timeit(number) < MIN_TIME:
+        number *= 2
+
+    samples = [t / number for t in timer.repeat(repeat, number)]
+
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def run(pattern: str = None, repeat: int = REPEAT):
+    """
+    모든 벤치마크를 실행, 필요한 패키지가 없는 벤치마크는 건너뜀
+
+    Args:
+        pattern (str, optional): 이름에 이 문자열이 포함된 벤치마크만 실행
+        repeat (int, optional): 측정 구간의 수
+
+    Returns:
+        dict: JSON으로 저장할 실행 결과
+    """
+
+    results = {}
+    skipped = {}
+
+    for name, bench, sizes in BENCHMARKS:
+        if pattern and pattern not in name:
+            continue
+
+        for size in sizes:
+            key = f'{name}[{size}]'
+
+            # 실행할 때마다 같은 입력을 사용하도록 고정
+            random.seed(key)
+
+            try:
+                func = bench(size)
+            except ImportError as e:
+                skipped[key] = str(e)
+                print(f'{key:<40} 건너뜀 ({e})')
+                continue
+
+            results[key] = measure(func, repeat)
+            print(f'{key:<40} {results[key]["median"] * 1e6:14.1f} us '
+                  f'(± {results[key]["stdev"] * 1e6:.1f})', flush=True)
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        # 측정에 사용한 eccore의 backend (EC_BACKEND 환경 변수로 선택)
+        'backend': load_eccore().backend.NAME,
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def compare(old: dict, new: dict, threshold: float = THRESHOLD):
+    """
+    두 실행 결과의 중앙값을 비교하여 회귀를 출력
+    기준 실행에 있던 벤치마크가 새 실행에 없으면 (ImportError 등으로 실행되지 않은 경우) 회귀와 같이 처리
+
+    Args:
+        old (dict): 기준 실행 결과
+        new (dict): 비교할 실행 결과
+        threshold (float, optional): 회귀로 판단하는 느려진 비율
+
+    Returns:
+        list: 회귀가 발생했거나 새 실행에서 빠진 벤치마크의 이름 목록
+    """
+
+    regressions = []
+
+    for key in sorted(set(old['results']) - set(new['results'])):
+        print(f'{key:<40} {old["results"][key]["median"] * 1e6:14.1f} us -> {"-":>14}    MISSING')
+        regressions.append(key)
+
+    for key in sorted(set(new['results']) - set(old['results'])):
+        print(f'{key:<40} {"-":>14}    -> {new["results"][key]["median"] * 1e6:14.1f} us        new')
+
+    for key in sorted(set(old['results']) & set(new['results'])):
+        before = old['results'][key]['median']
+        after = new['results'][key]['median']
+        ratio = after / before
+        flag = ''
+
+        if ratio > 1 + threshold:
+            flag = 'REGRESSION'
+            regressions.append(key)
+        elif ratio < 1 - threshold:
+            flag = 'improved'
+
+        print(f'{key:<40} {before * 1e6:14.1f} us -> {after * 1e6:14.1f} us {ratio:6.2f}x {flag}')
+
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='암호 예제의 주요 함수에 대한 벤치마크')
+    parser.add_argument('-o', '--output', help='실행 결과를 저장할 JSON 파일')
+    parser.add_argument('-k', '--pattern', help='이름에 이 문자열이 포함된 벤치마크만 실행')
+    parser.add_argument('-r', '--repeat', type=int, default=REPEAT, help='측정 구간의 수')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='두 JSON 결과를 비교')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='회귀로 판단하는 느려진 비율')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+
+        # 회귀가 있거나 빠진 벤치마크가 있으면 CI에서 실패하도록 종료 코드 1을 반환
+        sys.exit(1 if compare(old, new, args.threshold) else 0)
+
+    result = run(args.pattern, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
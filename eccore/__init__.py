@@ -0,0 +1,183 @@
+import os
+import time
+import random
+import hashlib
+import importlib
+
+from .curve import (
+    P, G, N, INFINITY, extended_euclidian, add, on_curve, compress, decompress,
+    to_jacobian, from_jacobian, jacobian_double, jacobian_add,
+    jacobian_double_and_add, double_and_add,
+    glv_split, endomorphism, glv_double_and_add, jacobian_montgomery_ladder, montgomery_ladder,
+    batch_inverse, batch_from_jacobian,
+    build_fixed_base_table, get_fixed_base_table,
+    jacobian_fixed_base_double_and_add, fixed_base_double_and_add,
+    wnaf, jacobian_strauss, jacobian_multi_double_and_add, multi_double_and_add,
+)
+
+# 사용할 수 있는 backend (앞에 있을수록 우선하여 선택)
+BACKENDS = ['coincurve', 'gmpy2', 'python']
+
+# 현재 사용 중인 backend module
+backend = None
+
+
+def load_backend(name: str):
+    """
+    이름에 해당하는 backend module을 읽음
+
+    Args:
+        name (str): BACKENDS 중 하나
+
+    Raises:
+        ImportError: backend가 없거나 필요한 패키지가 설치되지 않은 경우
+
+    Returns:
+        module: backend module
+    """
+
+    if name not in BACKENDS:
+        raise ImportError(f'알 수 없는 backend: {name}')
+
+    return importlib.import_module(f'{__name__}.backend_{name}')
+
+
+def set_backend(name: str = None):
+    """
+    사용할 backend를 선택
+    name을 지정하지 않으면 BACKENDS 중 설치된 첫 번째 backend를 사용
+
+    Args:
+        name (str, optional): backend의 이름
+
+    Returns:
+        module: 선택된 backend module
+    """
+
+    global backend
+
+    if name:
+        backend = load_backend(name)
+        return backend
+
+    for candidate in BACKENDS:
+        try:
+            backend = load_backend(candidate)
+            return backend
+        except ImportError:
+            continue
+
+
+# import할 때 EC_BACKEND 환경 변수 또는 설치된 패키지에 따라 backend를 선택
+set_backend(os.environ.get('EC_BACKEND'))
+
+
+def multiply(x: int, g: tuple):
+    """
+    x * g
+
+    Args:
+        x (int): 스칼라
+        g (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x * g의 결과 값 (무한원점이면 None)
+    """
+
+    return backend.multiply(x, g)
+
+
+def multiply_generator(x: int):
+    """
+    x * G
+
+    Args:
+        x (int): 스칼라
+
+    Returns:
+        tuple: x * G의 결과 값 (무한원점이면 None)
+    """
+
+    return backend.multiply_generator(x)
+
+
+def multiply_generator_many(xs: list):
+    """
+    여러 스칼라에 대한 x * G
+
+    Args:
+        xs (list): 스칼라 목록
+
+    Returns:
+        list: x * G의 결과 목록 (무한원점은 None)
+    """
+
+    return backend.multiply_generator_many(xs)
+
+
+def multiply_two(x1: int, g1: tuple, x2: int, g2: tuple):
+    """
+    x1 * g1 + x2 * g2
+
+    Args:
+        x1 (int): g1에 곱할 스칼라
+        g1 (tuple): 타원 곡선 상의 점 (affine)
+        x2 (int): g2에 곱할 스칼라
+        g2 (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x1 * g1 + x2 * g2의 결과 값 (무한원점이면 None)
+    """
+
+    return backend.multiply_two(x1, g1, x2, g2)
+
+
+def multiply_two_jacobian(x1: int, g1: tuple, x2: int, g2: tuple):
+    """
+    x1 * g1 + x2 * g2의 Jacobian 좌표
+    pure Python 계열의 backend에서는 affine 좌표로 변환하는 역원 계산을 생략할 수 있음
+
+    Args:
+        x1 (int): g1에 곱할 스칼라
+        g1 (tuple): 타원 곡선 상의 점 (affine)
+        x2 (int): g2에 곱할 스칼라
+        g2 (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x1 * g1 + x2 * g2의 Jacobian 좌표 (무한원점이면 Z = 0)
+    """
+
+    return backend.multiply_two_jacobian(x1, g1, x2, g2)
+
+
+def generate_public_key(d: int):
+    """
+    개인키를 통해 공개키를 생성
+
+    Args:
+        d (int): 개인키
+
+    Returns:
+        tuple: G를 key 만큼 곱한 공개키
+    """
+
+    return multiply_generator(d)
+
+
+def generate_private_key():
+    """
+    256비트의 난수를 생성하고, 이를 개인키로 이용하기 위한 함수
+
+    Returns:
+        int: 256비트 난수 개인키
+    """
+
+    while True:
+        # 개인키의 randomness를 강화하기 위하여 os.urandom()과 random.random(), 그리고 time.time()을 모두 적용한 문자열을 생성
+        text = f'{os.urandom(16).hex()}{random.random()}{time.time()}'
+        # hashlib.sha256() 함수를 이용하여 256비트의 난수를 생성
+        key = int(hashlib.sha256(text.encode()).hexdigest(), 16)
+
+        # SECP256K1 곡선의 N보다 작으면 개인키로 사용하고, 아니면 또 다른 난수를 다시 생성
+        if N > key:
+            return key
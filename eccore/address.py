@@ -0,0 +1,120 @@
+import hashlib
+import base58check
+from Crypto.Hash import RIPEMD160
+
+# 주소 생성에만 필요한 pycryptodome, base58check 패키지를 사용하므로 eccore/__init__.py에서는 import하지 않음
+# (from eccore.address import ...로 사용)
+from . import generate_public_key, multiply_generator_many
+from .curve import compress
+
+
+def key_hash160(key: bytes):
+    """
+    압축 공개키의 SHA-256, RIPEMD-160 hash를 계산
+
+    Args:
+        key (bytes): 압축 공개키
+
+    Returns:
+        bytes: 20 bytes의 RIPEMD-160 hash
+    """
+
+    # 2. Perform SHA-256 hashing on the public key
+    # 3. Perform RIPEMD-160 hashing on the result of SHA-256
+    return RIPEMD160.new(hashlib.sha256(key).digest()).digest()
+
+
+def hash160(x: int, y: int):
+    """
+    공개키 (x, y)의 압축 공개키에 대한 hash160
+
+    Args:
+        x (int): 공개키의 x 좌표
+        y (int): 공개키의 y 좌표
+
+    Returns:
+        bytes: 20 bytes의 RIPEMD-160 hash
+    """
+
+    return key_hash160(compress((x, y)))
+
+
+def address_bytes(x: int, y: int):
+    """
+    공개키 (x, y)로부터 25 bytes의 binary 비트코인 주소를 생성
+    중간 결과를 16진수 문자열로 변환하지 않고 digest를 그대로 사용
+
+    Args:
+        x (int): 공개키의 x 좌표
+        y (int): 공개키의 y 좌표
+
+    Returns:
+        bytes: 0x00 + RIPEMD-160 hash + checksum
+    """
+
+    # 4. Add version byte in front of RIPEMD-160 hash (0x00 for Main Network)
+    hash = b'\x00' + hash160(x, y)
+
+    # 5. Perform SHA-256 hash on the extended RIPEMD-160 result
+    # 6. Perform SHA-256 hash on the result of the previous SHA-256 hash
+    # 7. Take the first 4 bytes of the second SHA-256 hash. This is the address checksum
+    # 8. Add the 4 checksum bytes from stage 7 at the end of extended RIPEMD-160 hash from stage 4. This is the 25-byte binary Bitcoin Address.
+    return hash + hashlib.sha256(hashlib.sha256(hash).digest()).digest()[:4]
+
+
+def encode_addr(addr: bytes):
+    """
+    binary 비트코인 주소를 출력하기 위한 문자열로 변환
+
+    Args:
+        addr (bytes): address_bytes()의 결과
+
+    Returns:
+        hash, address: 공개키의 Hash 값(16진수)과, 비트코인 주소를 반환
+    """
+
+    # 9. Convert the result from a byte string into a base58 string using Base58Check encoding. This is the most commonly used Bitcoin Address format
+    return addr[:21].hex(), base58check.b58encode(addr).decode()
+
+
+def generate_addr(private_key: int):
+    """
+    압축 공개키를 이용하여 Public Key Hash를 생성하고,
+    이를 이용하여 비트코인 주소를 출력
+
+    Args:
+        private_key (int): 개인키
+
+    Returns:
+        hash, address: 공개키의 Hash 값과, 비트코인 주소를 반환
+    """
+
+    # 1. Take the corresponding public key generated with it
+    x, y = generate_public_key(private_key)
+
+    return encode_addr(address_bytes(x, y))
+
+
+def generate_addrs(private_keys, chunk_size: int = 1024):
+    """
+    여러 개의 개인키에 대한 Public Key Hash와 비트코인 주소를 차례대로 생성
+    chunk_size개의 공개키를 multiply_generator_many()로 한 번에 계산 (pure Python backend에서는 한 번의 역원 계산으로 affine 좌표로 변환)
+
+    Args:
+        private_keys (Iterable[int]): 개인키 목록
+        chunk_size (int, optional): 한 번에 계산할 공개키의 수
+
+    Yields:
+        hash, address: generate_addr()와 같은 형식의 공개키의 Hash 값과 비트코인 주소
+    """
+
+    private_keys = iter(private_keys)
+
+    while True:
+        chunk = [k for _, k in zip(range(chunk_size), private_keys)]
+
+        if not chunk:
+            return
+
+        for x, y in multiply_generator_many(chunk):
+            yield encode_addr(address_bytes(x, y))
@@ -0,0 +1,72 @@
+from coincurve import PublicKey
+
+from . import curve
+
+# backend의 이름 (EC_BACKEND 환경 변수에 사용)
+NAME = 'coincurve'
+# 점 연산을 libsecp256k1에서 수행하므로, pure Python의 테이블이나 Jacobian 좌표를 사용하면 오히려 느림
+NATIVE = True
+
+
+def to_public_key(a: tuple):
+    """
+    affine 좌표의 점을 coincurve의 PublicKey로 변환
+
+    Args:
+        a (tuple): affine 좌표의 점
+
+    Returns:
+        PublicKey: 비압축 형식(0x04 + x + y)으로 읽은 공개키
+    """
+
+    return PublicKey(b'\x04' + a[0].to_bytes(32, 'big') + a[1].to_bytes(32, 'big'))
+
+
+def multiply(x: int, g: tuple):
+    # libsecp256k1은 0이나 무한원점을 다루지 않으므로 직접 처리
+    x %= curve.N
+
+    if not x or g is None:
+        return None
+
+    try:
+        return to_public_key(g).multiply(x.to_bytes(32, 'big')).point()
+    except ValueError:
+        # 곡선 상의 점이 아니면 PublicKey()가 ValueError를 발생시키므로, 다른 backend와 같이 None
+        return None
+
+
+def multiply_generator(x: int):
+    # libsecp256k1의 x * G는 원래 상수 시간이므로 curve.USE_LADDER와 관계 없이 같은 방식을 사용
+    x %= curve.N
+
+    if not x:
+        return None
+
+    return PublicKey.from_secret(x.to_bytes(32, 'big')).point()
+
+
+def multiply_generator_many(xs: list):
+    return [multiply_generator(x) for x in xs]
+
+
+def multiply_two(x1: int, g1: tuple, x2: int, g2: tuple):
+    # multiply()의 None만으로는 무한원점과 곡선 상에 없는 점을 구분할 수 없으므로 먼저 확인
+    if not (curve.on_curve(g1) and curve.on_curve(g2)):
+        return None
+
+    points = [a for a in (multiply(x1, g1), multiply(x2, g2)) if a is not None]
+
+    if len(points) < 2:
+        return points[0] if points else None
+
+    try:
+        return PublicKey.combine_keys([to_public_key(a) for a in points]).point()
+    except ValueError:
+        # 두 점의 합이 무한원점인 경우
+        return None
+
+
+def multiply_two_jacobian(x1: int, g1: tuple, x2: int, g2: tuple):
+    # libsecp256k1은 affine 좌표를 반환하므로 Z = 1인 Jacobian 좌표로 변환
+    return curve.to_jacobian(multiply_two(x1, g1, x2, g2))
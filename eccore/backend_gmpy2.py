@@ -0,0 +1,99 @@
+from gmpy2 import mpz
+
+from . import curve
+
+# backend의 이름 (EC_BACKEND 환경 변수에 사용)
+NAME = 'gmpy2'
+# 점 연산은 curve의 pure Python 구현을 그대로 사용하고, 정수 연산만 GMP에서 수행
+NATIVE = False
+
+# mpz로 변환한 G의 고정점 테이블
+_g_table = None
+
+
+def to_mpz(a: tuple):
+    """
+    점의 좌표를 gmpy2의 mpz로 변환, 이후의 곱셈과 나머지 연산은 GMP에서 수행됨
+
+    Args:
+        a (tuple): affine 좌표의 점
+
+    Returns:
+        tuple: mpz 좌표의 점
+    """
+
+    return None if a is None else (mpz(a[0]), mpz(a[1]))
+
+
+def to_int(a: tuple):
+    """
+    mpz 좌표를 Python의 int로 변환
+
+    Args:
+        a (tuple): mpz 좌표의 점
+
+    Returns:
+        tuple: int 좌표의 점
+    """
+
+    return None if a is None else (int(a[0]), int(a[1]))
+
+
+def get_fixed_base_table():
+    """
+    curve의 고정점 테이블을 mpz로 변환하여 반환
+
+    Returns:
+        list: mpz 좌표의 고정점 테이블
+    """
+
+    global _g_table
+
+    if _g_table is None:
+        _g_table = [[to_mpz(point) for point in row] for row in curve.get_fixed_base_table()]
+
+    return _g_table
+
+
+def multiply(x: int, g: tuple):
+    # 곡선 상의 점이 아니면 다른 backend와 같이 None
+    if not curve.on_curve(g):
+        return None
+
+    if curve.USE_GLV:
+        return to_int(curve.glv_double_and_add(mpz(x), to_mpz(g)))
+
+    return to_int(curve.double_and_add(mpz(x), to_mpz(g)))
+
+
+def multiply_generator(x: int):
+    if curve.USE_LADDER:
+        return to_int(curve.montgomery_ladder(mpz(x), to_mpz(curve.G)))
+
+    return to_int(curve.fixed_base_double_and_add(mpz(x), get_fixed_base_table()))
+
+
+def multiply_generator_many(xs: list):
+    if curve.USE_LADDER:
+        points = [curve.jacobian_montgomery_ladder(mpz(x), to_mpz(curve.G)) for x in xs]
+    else:
+        table = get_fixed_base_table()
+        points = [curve.jacobian_fixed_base_double_and_add(mpz(x), table) for x in xs]
+
+    return [to_int(a) for a in curve.batch_from_jacobian(points)]
+
+
+def multiply_two(x1: int, g1: tuple, x2: int, g2: tuple):
+    if not (curve.on_curve(g1) and curve.on_curve(g2)):
+        return None
+
+    return to_int(curve.multi_double_and_add(mpz(x1), to_mpz(g1), mpz(x2), to_mpz(g2)))
+
+
+def multiply_two_jacobian(x1: int, g1: tuple, x2: int, g2: tuple):
+    if not (curve.on_curve(g1) and curve.on_curve(g2)):
+        return curve.INFINITY
+
+    X, Y, Z = curve.jacobian_multi_double_and_add(mpz(x1), to_mpz(g1), mpz(x2), to_mpz(g2))
+
+    return int(X), int(Y), int(Z)
@@ -0,0 +1,99 @@
+from . import curve
+
+# backend의 이름 (EC_BACKEND 환경 변수에 사용)
+NAME = 'python'
+# 모든 연산을 pure Python으로 수행
+NATIVE = False
+
+
+def multiply(x: int, g: tuple):
+    """
+    x * g, curve.USE_GLV가 True이면 GLV 방식을 사용
+
+    Args:
+        x (int): 스칼라
+        g (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x * g의 결과 값 (무한원점이거나 g가 곡선 상의 점이 아니면 None)
+    """
+
+    if not curve.on_curve(g):
+        return None
+
+    if curve.USE_GLV:
+        return curve.glv_double_and_add(x, g)
+
+    return curve.double_and_add(x, g)
+
+
+def multiply_generator(x: int):
+    """
+    고정점 테이블을 이용한 x * G
+    curve.USE_LADDER가 True이면 스칼라의 0인 window를 건너뛰지 않도록 Montgomery ladder를 사용
+
+    Args:
+        x (int): 스칼라
+
+    Returns:
+        tuple: x * G의 결과 값 (무한원점이면 None)
+    """
+
+    if curve.USE_LADDER:
+        return curve.montgomery_ladder(x, curve.G)
+
+    return curve.fixed_base_double_and_add(x)
+
+
+def multiply_generator_many(xs: list):
+    """
+    여러 스칼라에 대한 x * G, 모든 결과를 한 번의 역원 계산으로 affine 좌표로 변환
+
+    Args:
+        xs (list): 스칼라 목록
+
+    Returns:
+        list: x * G의 결과 목록 (무한원점은 None)
+    """
+
+    if curve.USE_LADDER:
+        return curve.batch_from_jacobian([curve.jacobian_montgomery_ladder(x, curve.G) for x in xs])
+
+    return curve.batch_from_jacobian([curve.jacobian_fixed_base_double_and_add(x) for x in xs])
+
+
+def multiply_two(x1: int, g1: tuple, x2: int, g2: tuple):
+    """
+    Strauss-Shamir 방식의 x1 * g1 + x2 * g2
+
+    Args:
+        x1 (int): g1에 곱할 스칼라
+        g1 (tuple): 타원 곡선 상의 점 (affine)
+        x2 (int): g2에 곱할 스칼라
+        g2 (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x1 * g1 + x2 * g2의 결과 값 (무한원점이거나 곡선 상의 점이 아닌 입력이 있으면 None)
+    """
+
+    return curve.from_jacobian(multiply_two_jacobian(x1, g1, x2, g2))
+
+
+def multiply_two_jacobian(x1: int, g1: tuple, x2: int, g2: tuple):
+    """
+    Strauss-Shamir 방식의 x1 * g1 + x2 * g2를 역원 계산 없이 Jacobian 좌표로 반환
+
+    Args:
+        x1 (int): g1에 곱할 스칼라
+        g1 (tuple): 타원 곡선 상의 점 (affine)
+        x2 (int): g2에 곱할 스칼라
+        g2 (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x1 * g1 + x2 * g2의 Jacobian 좌표 (곡선 상의 점이 아닌 입력이 있으면 무한원점)
+    """
+
+    if not (curve.on_curve(g1) and curve.on_curve(g2)):
+        return curve.INFINITY
+
+    return curve.jacobian_multi_double_and_add(x1, g1, x2, g2)
@@ -0,0 +1,94 @@
+import sys
+import random
+
+from . import curve, BACKENDS, load_backend
+
+# 알려진 결과: 2 * G
+G2 = (0xC6047F9441ED7D6D3045406E95C07CD85C778E4B8CEF3CA7ABAC09B95C709EE5,
+      0x1AE168FEA63DC339A3C58419466CEAEEF7F632653266D0E1236431A950CFE52A)
+
+
+def check(backend, count: int = 20):
+    """
+    backend의 결과를 알려진 값과 pure Python 구현(curve)의 결과와 비교
+
+    Args:
+        backend (module): 검사할 backend
+        count (int, optional): 임의의 스칼라로 비교할 횟수
+
+    Raises:
+        AssertionError: 결과가 다른 경우
+    """
+
+    G, N = curve.G, curve.N
+
+    # 알려진 값과 경계 값
+    assert backend.multiply_generator(1) == G
+    assert backend.multiply_generator(2) == G2
+    assert backend.multiply(2, G) == G2
+    assert backend.multiply_generator(N - 1) == (G[0], curve.P - G[1])
+    assert backend.multiply_generator(N) is None
+    assert backend.multiply(0, G) is None
+    assert backend.multiply_two(1, G, N - 1, G) is None
+    assert curve.montgomery_ladder(0, G) is None
+    assert curve.montgomery_ladder(N, G) is None
+    assert curve.montgomery_ladder(N - 1, G) == (G[0], curve.P - G[1])
+    assert backend.multiply_two(0, G, 2, G) == G2
+
+    # 무한원점 (None)
+    assert backend.multiply(5, None) is None
+    assert backend.multiply_two(1, G, 3, None) == G
+    assert backend.multiply_two(3, None, 2, G) == G2
+    assert backend.multiply_two(3, None, 5, None) is None
+    assert curve.from_jacobian(backend.multiply_two_jacobian(1, G, 3, None)) == G
+
+    # 곡선 상의 점이 아닌 경우 예외 없이 None
+    off = (1, 2)
+    assert not curve.on_curve(off)
+    assert backend.multiply(3, off) is None
+    assert backend.multiply_two(1, G, 3, off) is None
+    assert backend.multiply_two(3, off, 1, G) is None
+    assert backend.multiply_two(1, G, 0, off) is None
+    assert backend.multiply_two_jacobian(1, G, 3, off)[2] == 0
+
+    rng = random.Random(0)
+    keys = [rng.randrange(1, N) for _ in range(count)]
+    points = [curve.double_and_add(k, G) for k in keys]
+
+    assert backend.multiply_generator_many(keys) == points
+
+    for k, point in zip(keys, points):
+        assert backend.multiply_generator(k) == point
+
+        x1, x2 = rng.randrange(N), rng.randrange(N)
+        assert backend.multiply(x1, point) == curve.double_and_add(x1, point)
+        assert curve.montgomery_ladder(x1, point) == curve.double_and_add(x1, point)
+        expected = curve.from_jacobian(curve.jacobian_add(curve.jacobian_double_and_add(x1, curve.to_jacobian(G)),
+                                                          curve.jacobian_double_and_add(x2, curve.to_jacobian(point))))
+        assert backend.multiply_two(x1, G, x2, point) == expected
+        assert curve.from_jacobian(backend.multiply_two_jacobian(x1, G, x2, point)) == expected
+
+
+if __name__ == '__main__':
+    failed = False
+
+    for name in BACKENDS:
+        try:
+            backend = load_backend(name)
+        except ImportError as e:
+            print(f'{name:<10} 건너뜀 ({e})')
+            continue
+
+        # 기본 방식, GLV 방식, x * G에 Montgomery ladder를 사용하는 경우를 모두 검사
+        for use_glv, use_ladder in ((False, False), (True, False), (False, True)):
+            curve.USE_GLV, curve.USE_LADDER = use_glv, use_ladder
+            mode = f'GLV={use_glv!s:<5} LADDER={use_ladder!s:<5}'
+
+            try:
+                check(backend)
+                print(f'{name:<10} {mode} 통과')
+            except AssertionError:
+                failed = True
+                print(f'{name:<10} {mode} 실패')
+
+    sys.exit(1 if failed else 0)
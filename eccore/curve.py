@@ -0,0 +1,808 @@
+import os
+
+# SECP256K1 타원 곡선의 P
+P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+# SECP256K1 타원 곡선 상의 고정된 점 G (generator)
+G = (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+     0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
+# G의 위수 (N * G = 무한원점)
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+
+def extended_euclidian(n, b):
+    """
+    Extended Euclidian 알고리즘
+    곱셈에 대한 역원을 구하기 위해 사용함
+
+    Args:
+        n (Any): gcd(n, b)에서의 n
+        b (Any): gcd(n, b)에서의 b
+
+    Returns:
+        Any: 곱셈에 대한 역원
+    """
+
+    # r1 <- n; r2 <- b; t1 <- 0; t2 <- 1;
+    r1, r2, t1, t2 = n, b % n, 0, 1
+
+    while r2 > 0:
+        # q <- r1 / r2;
+        q = r1 // r2
+
+        # r <- r1 - q * r2;
+        r = r1 - q * r2
+        # r1 <- r2; r2 <- r;
+        r1, r2 = r2, r
+        # t <- t1 + q * t2;
+        t = t1 - q * t2
+        # t1 <- t2; t2 <- t;
+        t1, t2 = t2, t
+
+    return t1 % n
+
+
+def add(a: tuple, b: tuple):
+    """
+    타원 곡선 상의 덧셈 연산
+
+    Args:
+        a (tuple): 타원 곡선 상의 두 점 중 P
+        b (tuple): 타원 곡선 상의 두 점 중 Q
+
+    Returns:
+        tuple: 타원 곡선 상의 덧셈 결과
+    """
+
+    tmp = None
+
+    if a == b:
+        # b의 경우: λ = (3x1^2 + a)/(2y1)
+        tmp = ((3 * a[0] * a[0]) * extended_euclidian(P, 2 * b[1])) % P
+    else:
+        # a의 경우, P와 Q를 지나는 직선의 방정식
+        tmp = ((b[1] - a[1]) * extended_euclidian(P, b[0] - a[0])) % P
+
+    x = (tmp ** 2 - a[0] - b[0]) % P
+    y = (tmp * (a[0] - x) - a[1]) % P
+
+    return x, y
+
+
+def on_curve(a: tuple):
+    """
+    점이 y^2 = x^3 + 7 (mod P)를 만족하는지 확인
+
+    Args:
+        a (tuple): affine 좌표의 점, 무한원점은 None
+
+    Returns:
+        bool: 곡선 상의 점인지에 대한 여부
+    """
+
+    if a is None:
+        return True
+
+    x, y = a
+
+    return 0 <= x < P and 0 <= y < P and (y * y - x * x * x - 7) % P == 0
+
+
+def compress(a: tuple):
+    """
+    점을 33 bytes의 압축 형식으로 변환 (y의 홀짝을 나타내는 1 byte + x 좌표 32 bytes)
+
+    Args:
+        a (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        bytes: 압축된 점
+    """
+
+    return (b'\x03' if a[1] & 1 else b'\x02') + a[0].to_bytes(32, 'big')
+
+
+def decompress(data: bytes):
+    """
+    압축된 점으로부터 y 좌표를 복원
+    y^2 = x^3 + 7 (mod P)이고 P ≡ 3 (mod 4)이므로, 제곱근은 (x^3 + 7)^((P + 1) / 4) mod P
+
+    Args:
+        data (bytes): compress()의 결과 (33 bytes)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 x가 곡선 상의 점이 아닌 경우
+
+    Returns:
+        tuple: 복원된 점 (affine)
+    """
+
+    if len(data) != 33 or data[0] not in (2, 3):
+        raise ValueError('압축된 점의 형식이 아님')
+
+    x = int.from_bytes(data[1:], 'big')
+
+    if x >= P:
+        raise ValueError('x 좌표가 P 이상임')
+
+    yy = (x * x * x + 7) % P
+    y = pow(yy, (P + 1) // 4, P)
+
+    if y * y % P != yy:
+        raise ValueError('곡선 상의 점이 아님')
+
+    # 첫 byte의 홀짝과 다르면 다른 제곱근 P - y를 사용
+    if y & 1 != data[0] & 1:
+        y = P - y
+
+    return x, y
+
+
+# Jacobian 좌표계에서의 무한원점 (Z = 0)
+INFINITY = (1, 1, 0)
+
+
+def to_jacobian(a: tuple):
+    """
+    Affine 좌표 (x, y)를 Jacobian 좌표 (X, Y, Z)로 변환
+    x = X / Z^2, y = Y / Z^3의 관계를 가지며, 변환 시 Z = 1로 둠
+
+    Args:
+        a (tuple): affine 좌표의 점, 무한원점은 None
+
+    Returns:
+        tuple: Jacobian 좌표의 점
+    """
+
+    if a is None:
+        return INFINITY
+
+    return a[0], a[1], 1
+
+
+def from_jacobian(a: tuple):
+    """
+    Jacobian 좌표 (X, Y, Z)를 Affine 좌표 (x, y)로 변환
+    전체 연산 중 역원 계산은 이 함수에서 단 한 번만 수행됨
+
+    Args:
+        a (tuple): Jacobian 좌표의 점
+
+    Returns:
+        tuple: affine 좌표의 점, 무한원점이면 None
+    """
+
+    X, Y, Z = a
+
+    if Z == 0:
+        return None
+
+    z_inv = extended_euclidian(P, Z)
+    z_inv2 = z_inv * z_inv % P
+
+    return X * z_inv2 % P, Y * z_inv2 * z_inv % P
+
+
+def jacobian_double(a: tuple):
+    """
+    Jacobian 좌표 상의 2배 연산 (SECP256K1은 a = 0)
+    역원 계산 없이 곱셈만으로 계산
+
+    Args:
+        a (tuple): Jacobian 좌표의 점
+
+    Returns:
+        tuple: 2P의 Jacobian 좌표
+    """
+
+    X1, Y1, Z1 = a
+
+    if Z1 == 0 or Y1 == 0:
+        return INFINITY
+
+    A = X1 * X1 % P
+    B = Y1 * Y1 % P
+    C = B * B % P
+    # D = 2((X1 + B)^2 - A - C) = 4 * X1 * Y1^2
+    D = 2 * ((X1 + B) ** 2 - A - C) % P
+    # E = 3 * X1^2 (a = 0)
+    E = 3 * A % P
+
+    X3 = (E * E - 2 * D) % P
+    Y3 = (E * (D - X3) - 8 * C) % P
+    Z3 = 2 * Y1 * Z1 % P
+
+    return X3, Y3, Z3
+
+
+def jacobian_add(a: tuple, b: tuple):
+    """
+    Jacobian 좌표 상의 덧셈 연산
+    b의 Z가 1인 경우(affine 점을 더하는 경우) 일부 곱셈을 생략함
+
+    Args:
+        a (tuple): Jacobian 좌표의 점 P
+        b (tuple): Jacobian 좌표의 점 Q
+
+    Returns:
+        tuple: P + Q의 Jacobian 좌표
+    """
+
+    if a[2] == 0:
+        return b
+    if b[2] == 0:
+        return a
+
+    X1, Y1, Z1 = a
+    X2, Y2, Z2 = b
+
+    Z1Z1 = Z1 * Z1 % P
+    U2 = X2 * Z1Z1 % P
+    S2 = Y2 * Z1 * Z1Z1 % P
+
+    if Z2 == 1:
+        U1, S1 = X1, Y1
+    else:
+        Z2Z2 = Z2 * Z2 % P
+        U1 = X1 * Z2Z2 % P
+        S1 = Y1 * Z2 * Z2Z2 % P
+
+    if U1 == U2:
+        # P == Q이면 2배 연산, P == -Q이면 무한원점
+        if S1 != S2:
+            return INFINITY
+        return jacobian_double(a)
+
+    H = (U2 - U1) % P
+    R = (S2 - S1) % P
+    H2 = H * H % P
+    H3 = H * H2 % P
+    U1H2 = U1 * H2 % P
+
+    X3 = (R * R - H3 - 2 * U1H2) % P
+    Y3 = (R * (U1H2 - X3) - S1 * H3) % P
+    Z3 = H * Z1 * Z2 % P
+
+    return X3, Y3, Z3
+
+
+def jacobian_double_and_add(x: int, g: tuple):
+    """
+    Jacobian 좌표 상의 Double-and-Add 알고리즘
+    중간 결과에서 역원을 계산하지 않으므로 affine 방식보다 빠름
+
+    Args:
+        x (int): 스칼라 (개인키)
+        g (tuple): Jacobian 좌표의 점
+
+    Returns:
+        tuple: x * g의 Jacobian 좌표
+    """
+
+    result = INFINITY
+
+    # left-to-right로 k의 비트를 조사
+    for bit in bin(x)[2:]:
+        result = jacobian_double(result)
+
+        if bit == '1':
+            result = jacobian_add(result, g)
+
+    return result
+
+
+def double_and_add(x: int, g: tuple):
+    """
+    Double-and-Add 알고리즘
+    공개키를 만들기 위해 G를 x번 더하는 연산이 필요
+    개인키가 x라고 하면 공개 키는 x * G의 결과로 생성됨
+
+    Args:
+        x (int): 개인키 (256 bit)
+        g (tuple): 타원 곡선 상의 고정된 점 (공개)
+
+    Returns:
+        tuple: x * g의 결과 값 (무한원점이면 None)
+    """
+
+    # Jacobian 좌표로 계산한 후, 마지막에 한 번만 역원을 구하여 affine 좌표로 변환
+    return from_jacobian(jacobian_double_and_add(x, to_jacobian(g)))
+
+
+# 변수 기반의 다중 스칼라 곱셈에 GLV 방식을 사용할지에 대한 여부
+USE_GLV = os.environ.get('EC_GLV') == '1'
+# 개인키와 nonce의 x * G (공개키 생성, 서명)에 고정점 테이블 대신 Montgomery ladder를 사용할지에 대한 여부
+USE_LADDER = os.environ.get('EC_LADDER') == '1'
+# GLV endomorphism φ(x, y) = (β * x, y) = λ * (x, y)에 사용하는 상수
+BETA = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+# 스칼라를 분해하기 위한 격자의 기저 (a1 + b1 * λ ≡ a2 + b2 * λ ≡ 0 mod N)
+GLV_A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+GLV_B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+GLV_A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+GLV_B2 = GLV_A1
+
+
+def glv_split(x: int):
+    """
+    스칼라 x를 x ≡ x1 + x2 * λ (mod N)을 만족하는 약 128비트의 두 스칼라로 분해
+
+    Args:
+        x (int): 스칼라
+
+    Returns:
+        tuple: 부호가 있는 (x1, x2)
+    """
+
+    x %= N
+    c1 = (GLV_B2 * x + N // 2) // N
+    c2 = (-GLV_B1 * x + N // 2) // N
+
+    x1 = x - c1 * GLV_A1 - c2 * GLV_A2
+    x2 = -c1 * GLV_B1 - c2 * GLV_B2
+
+    return x1, x2
+
+
+def endomorphism(a: tuple):
+    """
+    φ(x, y) = (β * x, y), 곱셈 한 번으로 λ * a를 계산
+
+    Args:
+        a (tuple): 타원 곡선 상의 점 (affine), 무한원점은 None
+
+    Returns:
+        tuple: λ * a (무한원점이면 None)
+    """
+
+    if a is None:
+        return None
+
+    return BETA * a[0] % P, a[1]
+
+
+def glv_double_and_add(x: int, g: tuple):
+    """
+    GLV 방식의 스칼라 곱셈 x * g = x1 * g + x2 * φ(g)
+    약 128비트인 두 스칼라를 함께 처리하므로 2배 연산의 횟수가 절반으로 줄어듦
+
+    Args:
+        x (int): 스칼라
+        g (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x * g의 결과 값 (무한원점이면 None)
+    """
+
+    x1, x2 = glv_split(x)
+
+    return from_jacobian(jacobian_strauss([(x1, g), (x2, endomorphism(g))]))
+
+
+def jacobian_montgomery_ladder(x: int, g: tuple):
+    """
+    Montgomery ladder 방식의 스칼라 곱셈
+    비트 값과 관계없이 매 비트마다 덧셈 한 번과 2배 연산 한 번을 같은 순서로 수행하므로
+    개인키를 사용하는 연산에서 연산 패턴으로 비트가 드러나지 않음
+    (Python의 정수 연산 자체는 상수 시간이 아님)
+
+    Args:
+        x (int): 스칼라 (개인키)
+        g (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x * g의 Jacobian 좌표
+    """
+
+    x %= N
+    r = [INFINITY, to_jacobian(g)]
+
+    # 스칼라의 길이와 관계없이 항상 256비트를 조사
+    for i in range(255, -1, -1):
+        bit = x >> i & 1
+        r[1 - bit] = jacobian_add(r[0], r[1])
+        r[bit] = jacobian_double(r[bit])
+
+    return r[0]
+
+
+def montgomery_ladder(x: int, g: tuple):
+    """
+    Montgomery ladder 방식의 스칼라 곱셈의 affine 좌표 결과
+
+    Args:
+        x (int): 스칼라 (개인키)
+        g (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x * g의 결과 값 (무한원점이면 None)
+    """
+
+    return from_jacobian(jacobian_montgomery_ladder(x, g))
+
+
+# 고정점 G에 대한 window 크기 (4비트, 16진수 한 자리)
+G_TABLE_WINDOW = 4
+# 256비트 스칼라를 처리하기 위한 window의 개수
+G_TABLE_ROWS = 256 // G_TABLE_WINDOW
+# 미리 계산한 테이블을 저장할 파일 경로 (지정하지 않으면 메모리에만 유지)
+G_TABLE_PATH = os.environ.get('G_TABLE_PATH')
+# 테이블 파일의 헤더
+G_TABLE_MAGIC = b'G4TB'
+
+# 처음 사용할 때 생성되는 G의 고정점 테이블
+_g_table = None
+
+
+def batch_inverse(values: list, n: int):
+    """
+    Montgomery의 trick을 이용하여 여러 값의 역원을 한 번의 역원 계산으로 구함
+    모든 값의 누적 곱의 역원을 구한 후, 뒤에서부터 곱셈만으로 각 값의 역원을 복원
+
+    Args:
+        values (list): 역원을 구할 값의 목록 (0이 아니어야 함)
+        n (int): 법
+
+    Returns:
+        list: 각 값의 mod n에 대한 역원
+    """
+
+    prefix = []
+    acc = 1
+
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % n
+
+    inv = extended_euclidian(n, acc)
+    result = [0] * len(values)
+
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = prefix[i] * inv % n
+        inv = inv * values[i] % n
+
+    return result
+
+
+def batch_from_jacobian(points: list):
+    """
+    여러 개의 Jacobian 좌표를 한 번의 역원 계산으로 affine 좌표로 변환
+
+    Args:
+        points (list): Jacobian 좌표의 점 목록
+
+    Returns:
+        list: affine 좌표의 점 목록 (무한원점은 None)
+    """
+
+    index = [i for i, (_, _, Z) in enumerate(points) if Z]
+    result = [None] * len(points)
+
+    for i, z_inv in zip(index, batch_inverse([points[i][2] for i in index], P)):
+        X, Y, _ = points[i]
+        z_inv2 = z_inv * z_inv % P
+        result[i] = X * z_inv2 % P, Y * z_inv2 * z_inv % P
+
+    return result
+
+
+def build_fixed_base_table(g: tuple = G):
+    """
+    고정점 g에 대하여 table[i][j] = j * 16^i * g (1 <= j < 16)을 미리 계산
+    모든 점은 affine 좌표(Z = 1)로 저장하여 덧셈 시 곱셈을 줄임
+
+    Args:
+        g (tuple, optional): 테이블을 만들 점, 기본값은 G
+
+    Returns:
+        list: G_TABLE_ROWS x 15 크기의 affine 좌표 테이블
+    """
+
+    points = []
+    base = to_jacobian(g)
+
+    for _ in range(G_TABLE_ROWS):
+        point = base
+
+        for _ in range(1, 1 << G_TABLE_WINDOW):
+            points.append(point)
+            point = jacobian_add(point, base)
+
+        # 다음 행의 기준점: 16^(i+1) * g
+        base = point
+
+    # 모든 점을 한 번의 역원 계산으로 affine 좌표로 변환
+    points = batch_from_jacobian(points)
+    width = (1 << G_TABLE_WINDOW) - 1
+
+    return [points[i:i + width] for i in range(0, len(points), width)]
+
+
+def save_fixed_base_table(table: list, path: str):
+    """
+    고정점 테이블을 binary 파일로 저장 (점 하나당 x, y 각 32 bytes)
+    여러 프로세스가 동시에 저장하더라도 파일이 깨지지 않도록 임시 파일을 이용
+
+    Args:
+        table (list): build_fixed_base_table()의 결과
+        path (str): 저장할 파일 경로
+    """
+
+    data = bytearray(G_TABLE_MAGIC)
+
+    for row in table:
+        for x, y in row:
+            data += x.to_bytes(32, 'big') + y.to_bytes(32, 'big')
+
+    tmp = f'{path}.{os.getpid()}.tmp'
+
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        # 쓰다가 실패한 임시 파일은 남기지 않음
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_fixed_base_table(path: str):
+    """
+    binary 파일로 저장된 고정점 테이블을 읽음
+    크기가 맞더라도 내용이 손상된 테이블은 잘못된 공개키와 서명을 만들므로,
+    모든 점이 곡선 상에 있고 처음 두 점이 G, 2G인지 확인함
+
+    Args:
+        path (str): 테이블 파일 경로
+
+    Returns:
+        list: 고정점 테이블, 파일이 없거나 형식이 맞지 않거나 손상되었으면 None
+    """
+
+    size = len(G_TABLE_MAGIC) + G_TABLE_ROWS * ((1 << G_TABLE_WINDOW) - 1) * 64
+
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) != size or not data.startswith(G_TABLE_MAGIC):
+        return None
+
+    table = []
+    offset = len(G_TABLE_MAGIC)
+
+    for _ in range(G_TABLE_ROWS):
+        row = []
+
+        for _ in range(1, 1 << G_TABLE_WINDOW):
+            x = int.from_bytes(data[offset:offset + 32], 'big')
+            y = int.from_bytes(data[offset + 32:offset + 64], 'big')
+            row.append((x, y))
+            offset += 64
+
+        table.append(row)
+
+    if table[0][0] != G or table[0][1] != add(G, G) or not all(on_curve(a) for row in table for a in row):
+        return None
+
+    return table
+
+
+def get_fixed_base_table():
+    """
+    고정점 테이블을 반환, 처음 호출될 때 G_TABLE_PATH에서 읽거나 새로 계산함
+
+    Returns:
+        list: 고정점 테이블
+    """
+
+    global _g_table
+
+    if _g_table is None and G_TABLE_PATH:
+        _g_table = load_fixed_base_table(G_TABLE_PATH)
+
+    if _g_table is None:
+        _g_table = build_fixed_base_table()
+
+        # 파일 저장은 선택 사항이므로, 저장하지 못해도 메모리의 테이블을 그대로 사용
+        if G_TABLE_PATH:
+            try:
+                save_fixed_base_table(_g_table, G_TABLE_PATH)
+            except OSError:
+                pass
+
+    return _g_table
+
+
+def jacobian_fixed_base_double_and_add(x: int, table: list = None):
+    """
+    미리 계산한 테이블을 이용한 x * g 연산
+    스칼라를 4비트씩 나누어 각 window의 값에 해당하는 점을 더하기만 하므로 2배 연산이 필요 없음
+
+    Args:
+        x (int): 개인키 (256 bit)
+        table (list, optional): build_fixed_base_table(g)의 결과, None이면 G의 테이블
+
+    Returns:
+        tuple: x * g의 Jacobian 좌표
+    """
+
+    table = table or get_fixed_base_table()
+    mask = (1 << G_TABLE_WINDOW) - 1
+    result = INFINITY
+    x %= N
+
+    for i in range(G_TABLE_ROWS):
+        j = x & mask
+
+        if j:
+            result = jacobian_add(result, table[i][j - 1] + (1,))
+
+        x >>= G_TABLE_WINDOW
+
+    return result
+
+
+def fixed_base_double_and_add(x: int, table: list = None):
+    """
+    미리 계산한 테이블을 이용한 x * g 연산의 affine 좌표 결과
+
+    Args:
+        x (int): 개인키 (256 bit)
+        table (list, optional): build_fixed_base_table(g)의 결과, None이면 G의 테이블
+
+    Returns:
+        tuple: x * g의 결과 값 (무한원점이면 None)
+    """
+
+    return from_jacobian(jacobian_fixed_base_double_and_add(x, table))
+
+
+# 다중 스칼라 곱셈에서 사용하는 wNAF의 window 크기
+WNAF_WINDOW = 5
+
+
+def wnaf(x: int, w: int):
+    """
+    스칼라를 width-w NAF(wNAF) 형식으로 변환
+    0이 아닌 숫자는 홀수이고 절댓값이 2^(w-1)보다 작으며, 연속한 w개의 숫자 중 최대 하나만 0이 아님
+
+    Args:
+        x (int): 스칼라
+        w (int): window 크기
+
+    Returns:
+        list: 최하위 비트부터 나열한 wNAF 숫자 목록
+    """
+
+    digits = []
+    mask = (1 << w) - 1
+
+    while x:
+        d = 0
+
+        if x & 1:
+            d = x & mask
+
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+
+            x -= d
+
+        digits.append(d)
+        x >>= 1
+
+    return digits
+
+
+def odd_multiples(a: tuple, w: int):
+    """
+    wNAF 연산에 사용할 홀수 배수 1P, 3P, ..., (2^(w-1) - 1)P를 계산
+
+    Args:
+        a (tuple): Jacobian 좌표의 점
+        w (int): window 크기
+
+    Returns:
+        list: Jacobian 좌표의 홀수 배수 목록 (index i는 (2i + 1)P)
+    """
+
+    double = jacobian_double(a)
+    table = [a]
+
+    for _ in range((1 << (w - 2)) - 1):
+        table.append(jacobian_add(table[-1], double))
+
+    return table
+
+
+def jacobian_strauss(terms: list):
+    """
+    Strauss-Shamir 방식의 다중 스칼라 곱셈 x1 * g1 + x2 * g2 + ...
+    모든 스칼라를 wNAF로 변환한 후 하나의 2배 연산 loop에서 함께 처리하므로
+    각각 곱한 후 더하는 방식에 비해 2배 연산의 횟수가 크게 줄어듦
+
+    Args:
+        terms (list): (스칼라, affine 좌표의 점) 목록, 음수인 스칼라는 점을 반전하여 처리
+
+    Returns:
+        tuple: 모든 x * g의 합의 Jacobian 좌표
+    """
+
+    w = WNAF_WINDOW
+    tables = []
+
+    for x, g in terms:
+        # 무한원점 (None)은 합에 영향을 주지 않음
+        if g is None:
+            continue
+
+        if x < 0:
+            x, g = -x, (g[0], -g[1] % P)
+
+        tables.append((wnaf(x, w), odd_multiples(to_jacobian(g), w)))
+
+    result = INFINITY
+
+    # 최상위 숫자부터 조사
+    for i in range(max((len(digits) for digits, _ in tables), default=0) - 1, -1, -1):
+        result = jacobian_double(result)
+
+        for digits, table in tables:
+            if i >= len(digits) or not digits[i]:
+                continue
+
+            d = digits[i]
+
+            if d > 0:
+                result = jacobian_add(result, table[d >> 1])
+            else:
+                # 음수인 경우 -P = (X, -Y, Z)를 더함
+                X, Y, Z = table[-d >> 1]
+                result = jacobian_add(result, (X, -Y % P, Z))
+
+    return result
+
+
+def jacobian_multi_double_and_add(x1: int, g1: tuple, x2: int, g2: tuple):
+    """
+    다중 스칼라 곱셈 x1 * g1 + x2 * g2
+    USE_GLV가 True이면 각 스칼라를 GLV 방식으로 분해하여 네 개의 약 128비트 스칼라로 계산
+
+    Args:
+        x1 (int): g1에 곱할 스칼라
+        g1 (tuple): 타원 곡선 상의 점 (affine)
+        x2 (int): g2에 곱할 스칼라
+        g2 (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x1 * g1 + x2 * g2의 Jacobian 좌표
+    """
+
+    if not USE_GLV:
+        return jacobian_strauss([(x1, g1), (x2, g2)])
+
+    x11, x12 = glv_split(x1)
+    x21, x22 = glv_split(x2)
+
+    return jacobian_strauss([(x11, g1), (x12, endomorphism(g1)),
+                             (x21, g2), (x22, endomorphism(g2))])
+
+
+def multi_double_and_add(x1: int, g1: tuple, x2: int, g2: tuple):
+    """
+    다중 스칼라 곱셈 x1 * g1 + x2 * g2의 affine 좌표 결과
+
+    Args:
+        x1 (int): g1에 곱할 스칼라
+        g1 (tuple): 타원 곡선 상의 점 (affine)
+        x2 (int): g2에 곱할 스칼라
+        g2 (tuple): 타원 곡선 상의 점 (affine)
+
+    Returns:
+        tuple: x1 * g1 + x2 * g2의 결과 값 (무한원점이면 None)
+    """
+
+    return from_jacobian(jacobian_multi_double_and_add(x1, g1, x2, g2))